@@ -0,0 +1,316 @@
+"""
+Load test of the main endpoints of the API on a seeded dataset.
+
+    python -m benchmarks.api --users 10000 --posts 100000 --concurrency 8 --requests 500 --output results.json
+
+Requests go in process through Django's test client to a test database (test_<DB_NAME>)
+seeded with the factories of the post and user apps; --keepdb keeps it, and its seed,
+for the next runs. With --base-url they go over HTTP to a running server instead, and
+the database of the settings (the one the server uses) is seeded. Start that server
+with THROTTLE_LOGIN_RATE/THROTTLE_LOGIN_EMAIL_RATE high enough for the login scenario.
+
+Each scenario reports throughput, latency percentiles and database queries per request
+(from the blog_view_db_queries histogram). Data and requests derive from --seed, so runs
+of two commits with the same arguments are comparable.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+
+# Login is driven far above the production throttle rates
+for throttle_scope in ('LOGIN', 'LOGIN_EMAIL', 'SIGNUP'):
+    os.environ.setdefault(f'THROTTLE_{throttle_scope}_RATE', '1000000/s')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from django.test import Client  # noqa: E402
+from django.test.utils import setup_test_environment  # noqa: E402
+from prometheus_client import REGISTRY  # noqa: E402
+from prometheus_client.parser import text_string_to_metric_families  # noqa: E402
+
+from post.counters import rebuild_post_counters  # noqa: E402
+from post.models import Post  # noqa: E402
+from post.search import SEARCH_MODE_FULLTEXT, SEARCH_MODE_SUBSTRING  # noqa: E402
+from post.tests.factories import PostFactory  # noqa: E402
+from user.models import User  # noqa: E402
+from user.tests.factories import UserFactory  # noqa: E402
+from user.utils import generate_access_token  # noqa: E402
+
+PASSWORD = 'benchmark'
+WORDS = (
+    'django', 'postgres', 'cache', 'index', 'query', 'latency', 'python', 'async', 'replica', 'cursor',
+    'token', 'search', 'profile', 'thread', 'worker', 'metric', 'render', 'serializer', 'migration', 'trigger',
+    'blog', 'post', 'author', 'update', 'release', 'august', 'review', 'deploy', 'docker', 'prometheus',
+)
+
+
+def seed(users, posts, batch_size, rng):
+    """Create the missing users and posts, bench<n>@email.com all have PASSWORD."""
+    password = make_password(PASSWORD)
+    existing = User.objects.count()
+    for start in range(existing, users, batch_size):
+        User.objects.bulk_create([
+            UserFactory.build(displayName=f'benchmark user {index}', email=f'bench{index}@email.com', password=password)
+            for index in range(start, min(start + batch_size, users))
+        ])
+
+    user_ids = list(User.objects.order_by('id').values_list('id', flat=True))
+    existing = Post.objects.count()
+    for start in range(existing, posts, batch_size):
+        Post.objects.bulk_create([
+            PostFactory.build(title=' '.join(rng.sample(WORDS, 4)), content=' '.join(rng.choices(WORDS, k=60)), user_id=rng.choice(user_ids))
+            for _ in range(start, min(start + batch_size, posts))
+        ])
+    rebuild_post_counters()
+
+
+class Dataset:
+    """Samples of the seeded rows the scenarios pick from."""
+
+    def __init__(self, rng, size=5000):
+        self.users = list(User.objects.filter(email__startswith='bench').order_by('id').values_list('id', 'email')[:size])
+        self.posts = list(Post.objects.order_by('id').values_list('id', 'user_id')[:size * 4])
+        self.posts = rng.sample(self.posts, min(size, len(self.posts)))
+        self.tokens = {}
+
+    def token(self, user_id):
+        if user_id not in self.tokens:
+            self.tokens[user_id] = generate_access_token(User(id=user_id))
+        return self.tokens[user_id]
+
+
+def login(dataset, rng):
+    _, email = rng.choice(dataset.users)
+    return 'post', '/user/login', {'email': email, 'password': PASSWORD}, None
+
+
+def list_posts(dataset, rng):
+    user_id, _ = rng.choice(dataset.users)
+    return 'get', '/post', {'page_size': rng.choice((10, 20, 50))}, dataset.token(user_id)
+
+
+def get_post(dataset, rng):
+    post_id, user_id = rng.choice(dataset.posts)
+    return 'get', f'/post/{post_id}', None, dataset.token(user_id)
+
+
+def search(mode):
+    def build(dataset, rng):
+        user_id, _ = rng.choice(dataset.users)
+        return 'get', '/post/search', {'q': rng.choice(WORDS), 'mode': mode}, dataset.token(user_id)
+    return build
+
+
+def create_post(dataset, rng):
+    user_id, _ = rng.choice(dataset.users)
+    data = {'title': ' '.join(rng.sample(WORDS, 4)), 'content': ' '.join(rng.choices(WORDS, k=60))}
+    return 'post', '/post', data, dataset.token(user_id)
+
+
+def edit_post(dataset, rng):
+    post_id, user_id = rng.choice(dataset.posts)
+    data = {'title': ' '.join(rng.sample(WORDS, 4)), 'content': ' '.join(rng.choices(WORDS, k=60))}
+    return 'put', f'/post/{post_id}', data, dataset.token(user_id)
+
+
+# name -> (view label of the blog_view_* metrics, request builder)
+SCENARIOS = {
+    'login': ('LoginViewSet.login', login),
+    'list': ('PostViewSet.list', list_posts),
+    'detail': ('PostViewSet.get_post', get_post),
+    'search': ('PostViewSet.search', search(SEARCH_MODE_SUBSTRING)),
+    'search_fulltext': ('PostViewSet.search', search(SEARCH_MODE_FULLTEXT)),
+    'create': ('PostViewSet.post', create_post),
+    'edit': ('PostViewSet.edit_post', edit_post),
+}
+
+
+def query_totals(families):
+    """View -> (sum, count) of the blog_view_db_queries histogram."""
+    totals = {}
+    for family in families:
+        if family.name != 'blog_view_db_queries':
+            continue
+        for sample in family.samples:
+            view_sum, view_count = totals.get(sample.labels.get('view'), (0, 0))
+            if sample.name.endswith('_sum'):
+                view_sum = sample.value
+            elif sample.name.endswith('_count'):
+                view_count = sample.value
+            totals[sample.labels.get('view')] = (view_sum, view_count)
+    return totals
+
+
+class LocalTransport:
+    """Django's test client in this process, one per thread."""
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def request(self, method, path, data, token):
+        if not hasattr(self.local, 'client'):
+            self.local.client = Client()
+
+        extra = {'HTTP_AUTHORIZATION': token} if token else {}
+        if method == 'get':
+            return self.local.client.get(path, data, **extra).status_code
+        return getattr(self.local.client, method)(path, json.dumps(data), content_type='application/json', **extra).status_code
+
+    def query_totals(self):
+        return query_totals(REGISTRY.collect())
+
+
+class HTTPTransport:
+    """Requests over HTTP to a running server, one session per thread."""
+
+    def __init__(self, base_url):
+        import requests  # pylint: disable=import-outside-toplevel
+
+        self.requests = requests
+        self.base_url = base_url.rstrip('/')
+        self.local = threading.local()
+
+    def request(self, method, path, data, token):
+        if not hasattr(self.local, 'session'):
+            self.local.session = self.requests.Session()
+
+        headers = {'Authorization': token} if token else {}
+        if method == 'get':
+            return self.local.session.get(self.base_url + path, params=data, headers=headers).status_code
+        return self.local.session.request(method, self.base_url + path, json=data, headers=headers).status_code
+
+    def query_totals(self):
+        return query_totals(text_string_to_metric_families(self.requests.get(f'{self.base_url}/metrics').text))
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def close_worker_connections(executor, workers):
+    """Close the database connection of each worker thread, the test database can't be dropped while they are open."""
+    barrier = threading.Barrier(workers)
+
+    def close():
+        barrier.wait()
+        connections.close_all()
+
+    for future in [executor.submit(close) for _ in range(workers)]:
+        future.result()
+
+
+def run_scenario(transport, dataset, name, args):
+    view, build = SCENARIOS[name]
+
+    def send(index):
+        rng = random.Random(f'{args.seed}:{name}:{index}')
+        method, path, data, token = build(dataset, rng)
+        start = time.perf_counter()
+        status = transport.request(method, path, data, token)
+        return (time.perf_counter() - start) * 1000, status
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        list(executor.map(send, range(-args.warmup, 0)))
+
+        before = transport.query_totals().get(view, (0, 0))
+        start = time.perf_counter()
+        results = list(executor.map(send, range(args.requests)))
+        elapsed = time.perf_counter() - start
+        after = transport.query_totals().get(view, (0, 0))
+
+        close_worker_connections(executor, args.concurrency)
+
+    latencies = sorted(latency for latency, _ in results)
+    requests_counted = after[1] - before[1]
+    return {
+        'view': view,
+        'requests': len(results),
+        'errors': sum(1 for _, status in results if status >= 400),
+        'throughput_rps': round(len(results) / elapsed, 2),
+        'latency_ms': {
+            'mean': round(statistics.mean(latencies), 3),
+            'p50': round(percentile(latencies, 0.5), 3),
+            'p90': round(percentile(latencies, 0.9), 3),
+            'p99': round(percentile(latencies, 0.99), 3),
+            'max': round(latencies[-1], 3),
+        },
+        'queries_per_request': round((after[0] - before[0]) / requests_counted, 2) if requests_counted else None,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--posts', type=int, default=100000)
+    parser.add_argument('--requests', type=int, default=500, help='measured requests per scenario')
+    parser.add_argument('--warmup', type=int, default=20, help='requests per scenario before measuring')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--keepdb', action='store_true', help='keep the test database and its seed')
+    parser.add_argument('--base-url', help='benchmark a running server, e.g. http://localhost:8000')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    args = parser.parse_args()
+
+    if args.base_url:
+        transport = HTTPTransport(args.base_url)
+    else:
+        setup_test_environment()
+        old_name = connection.settings_dict['NAME']
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False, keepdb=args.keepdb)
+        transport = LocalTransport()
+
+    try:
+        seed(args.users, args.posts, args.batch_size, random.Random(args.seed))
+        dataset = Dataset(random.Random(args.seed))
+        results = {
+            'commit': git_commit(),
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'target': args.base_url or 'in-process',
+            'dataset': {'users': User.objects.count(), 'posts': Post.objects.count()},
+            'concurrency': args.concurrency,
+            'seed': args.seed,
+            'scenarios': {},
+        }
+
+        print(f'{"scenario":<18}{"rps":>10}{"mean ms":>10}{"p50 ms":>10}{"p90 ms":>10}{"p99 ms":>10}{"queries":>9}{"errors":>8}')
+        for name in args.scenarios:
+            result = run_scenario(transport, dataset, name, args)
+            results['scenarios'][name] = result
+            latency = result['latency_ms']
+            print(f'{name:<18}{result["throughput_rps"]:>10}{latency["mean"]:>10}{latency["p50"]:>10}{latency["p90"]:>10}'
+                  f'{latency["p99"]:>10}{str(result["queries_per_request"]):>9}{result["errors"]:>8}')
+    finally:
+        if not args.base_url:
+            connections.close_all()
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Bytes on the wire and CPU cost of the response compression, per encoding and level.
+
+    python -m benchmarks.compression --posts 20 100 --rounds 20
+
+Pages of ListPostSerializer posts are built in memory and rendered by the API renderer. For
+each encoding available (see blog.compression) and level, the compressed size is reported with
+the time to compress a page and the time a hit of the compression cache takes instead (the
+content digest and the cache lookup, in COMPRESSION_CACHE_BACKEND).
+"""
+import argparse
+import random
+import statistics
+import time
+
+from rest_framework.settings import api_settings
+
+from benchmarks.renderers import build_page
+from blog.compression import COMPRESSORS, compress
+
+# Levels tried when --levels isn't given
+LEVELS = {'gzip': (1, 6, 9), 'br': (1, 4, 6, 11), 'zstd': (1, 3, 9, 19)}
+
+
+def measure(func, rounds):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--posts', type=int, nargs='+', default=[20, 100], help='posts per rendered page')
+    parser.add_argument('--content-length', type=int, default=2000)
+    parser.add_argument('--encodings', nargs='+', choices=COMPRESSORS, default=list(COMPRESSORS))
+    parser.add_argument('--levels', type=int, nargs='+', help='levels of every encoding, defaults to a few of each')
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print(f'{"posts":>6}{"encoding":>10}{"level":>7}{"KiB":>10}{"ratio":>8}{"compress ms":>13}{"MiB/s":>8}{"cache hit ms":>14}')
+    for size in args.posts:
+        content = api_settings.DEFAULT_RENDERER_CLASSES[0]().render(build_page(size, args.content_length, random.Random(args.seed)))
+        print(f'{size:>6}{"identity":>10}{"":>7}{len(content) / 1024:>10.1f}')
+
+        for encoding in args.encodings:
+            for level in args.levels or LEVELS[encoding]:
+                compressed = COMPRESSORS[encoding](content, level)
+                compress_ms = measure(lambda: COMPRESSORS[encoding](content, level), args.rounds)  # pylint: disable=cell-var-from-loop
+
+                compress(content, encoding, level, True)
+                hit_ms = measure(lambda: compress(content, encoding, level, True), args.rounds)  # pylint: disable=cell-var-from-loop
+
+                print(f'{"":>6}{encoding:>10}{level:>7}{len(compressed) / 1024:>10.1f}{len(content) / len(compressed):>8.1f}'
+                      f'{compress_ms:>13.3f}{len(content) / 1048576 / (compress_ms / 1000):>8.0f}{hit_ms:>14.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Latency of a request's first query on a new connection (CONN_MAX_AGE=0), on a
+persistent one, and on a persistent one pinged by the health check first.
+
+    python -m benchmarks.connections --iterations 500
+
+Runs against the database configured by the DB_* env vars, point DB_HOST/DB_PORT
+to PgBouncer to compare it with a direct connection.
+"""
+import argparse
+import os
+import statistics
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog.settings')
+django.setup()
+
+from django.db import connection  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def persistent():
+    pass
+
+
+def health_check():
+    # A new request, its first query pings the connection (DB_CONN_HEALTH_CHECKS)
+    connection.close_if_unusable_or_obsolete()
+
+
+MODES = {
+    'new connection': connection.close,
+    'persistent': persistent,
+    'persistent + health check': health_check,
+}
+
+
+def measure(before_request, iterations):
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        before_request()
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--iterations', type=int, default=500)
+    args = parser.parse_args()
+
+    # Opens the connection the persistent modes reuse
+    connection.ensure_connection()
+
+    print(f'{"mode":<28}{"mean ms":>10}{"p50 ms":>10}{"p95 ms":>10}')
+    for name, before_request in MODES.items():
+        timings = sorted(measure(before_request, args.iterations))
+        p95 = timings[int(len(timings) * 0.95) - 1]
+        print(f'{name:<28}{statistics.mean(timings):>10.3f}{statistics.median(timings):>10.3f}{p95:>10.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,51 @@
+"""
+Throughput of the password check of /user/login at several PASSWORD_HASH_ITERATIONS,
+the hash dominates the CPU cost of a login.
+
+    python -m benchmarks.login --iterations 10000 100000 260000 --logins 20
+
+Logins per second are per core, a worker serves about that many logins per process.
+"""
+import argparse
+import os
+import statistics
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog.settings')
+django.setup()
+
+from django.contrib.auth.hashers import check_password, make_password  # noqa: E402 pylint: disable=wrong-import-position
+
+from user.hashers import PBKDF2PasswordHasher  # noqa: E402 pylint: disable=wrong-import-position
+
+
+def measure(iterations, logins):
+    hasher = PBKDF2PasswordHasher()
+    hasher.iterations = iterations
+    encoded = make_password('123456', hasher=hasher)
+
+    timings = []
+    for _ in range(logins):
+        start = time.perf_counter()
+        check_password('123456', encoded)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--iterations', type=int, nargs='+', default=[10000, 100000, 260000, 600000])
+    parser.add_argument('--logins', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f'{"iterations":>12}{"mean ms":>10}{"p50 ms":>10}{"logins/s":>10}')
+    for iterations in args.iterations:
+        timings = measure(iterations, args.logins)
+        mean = statistics.mean(timings)
+        print(f'{iterations:>12}{mean:>10.2f}{statistics.median(timings):>10.2f}{1000 / mean:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
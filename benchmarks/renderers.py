@@ -0,0 +1,79 @@
+"""
+Render time of ListPostSerializer pages with the stdlib and the orjson renderers of the API.
+
+    python -m benchmarks.renderers --posts 20 100 1000 --rounds 50
+
+Posts are built in memory (no database) with the content size of --content-length.
+Both renderers must return the same bytes, the run stops otherwise.
+"""
+import argparse
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from blog.renderers import JSONRenderer, ORJSONRenderer, orjson  # noqa: E402
+from post.models import Post  # noqa: E402
+from post.serializers import ListPostSerializer  # noqa: E402
+from user.models import User  # noqa: E402
+
+WORDS = ('atualização', 'blog', 'post', 'conteúdo', 'django', 'cache', 'índice', 'consulta', 'render', 'python')
+
+
+def build_page(size, content_length, rng):
+    start = datetime(2021, 8, 1, tzinfo=timezone.utc)
+    users = [
+        User(id=index, displayName=f'benchmark user {index}', email=f'bench{index}@email.com', image=f'http://images/{index}.png', updated=start)
+        for index in range(1, 51)
+    ]
+
+    post = []
+    for index in range(size):
+        content = ' '.join(rng.choices(WORDS, k=content_length // 8))[:content_length]
+        published = start + timedelta(seconds=index, microseconds=rng.randrange(1000000))
+        post.append(Post(id=index + 1, title=' '.join(rng.sample(WORDS, 4)), content=content, user=rng.choice(users),
+                         published=published, updated=published))
+    return ListPostSerializer(post, many=True).data
+
+
+def measure(renderer, data, rounds):
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        renderer.render(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--posts', type=int, nargs='+', default=[20, 100, 1000, 10000], help='posts per rendered page')
+    parser.add_argument('--content-length', type=int, default=2000)
+    parser.add_argument('--rounds', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    if orjson is None:
+        parser.error('orjson is not installed')
+
+    print(f'{"posts":>8}{"KiB":>10}{"json ms":>10}{"orjson ms":>11}{"speedup":>9}')
+    for size in args.posts:
+        data = build_page(size, args.content_length, random.Random(args.seed))
+        expected = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != expected:
+            raise SystemExit(f'the renderers disagree on a page of {size} posts')
+
+        stdlib = statistics.median(measure(JSONRenderer(), data, args.rounds))
+        fast = statistics.median(measure(ORJSONRenderer(), data, args.rounds))
+        print(f'{size:>8}{len(expected) / 1024:>10.1f}{stdlib:>10.3f}{fast:>11.3f}{stdlib / fast:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -9,8 +9,14 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 
 import os
 
-from django.core.asgi import get_asgi_application
+import django
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blog.settings')
+os.environ.setdefault('ROOT_URLCONF', 'blog.asgi_urls')
 
-application = get_asgi_application()
+# As get_asgi_application(), with the handler streaming async response bodies
+django.setup(set_prefix=False)
+
+from blog.asynchronous import ASGIHandler  # noqa: E402 pylint: disable=wrong-import-position
+
+application = ASGIHandler()
@@ -0,0 +1,19 @@
+"""URL configuration of blog.asgi
+
+Same routes as blog.urls, the post list/detail/search and user detail endpoints
+are served by async views (see blog.asynchronous.async_read_view).
+"""
+from django.contrib import admin
+from django.urls import include, path, re_path
+
+from blog import views
+from blog.profiling import CAPTURE_NAME_RE
+
+urlpatterns = [
+    path('admin/profiles/', views.profile_list, name='profiles'),
+    re_path(rf'^admin/profiles/(?P<name>{CAPTURE_NAME_RE})\.(?P<ext>json|prof)$', views.profile_download, name='profile'),
+    path('admin/', admin.site.urls),
+    path('user', include(('user.async_urls', 'user'), namespace='user')),
+    path('post', include(('post.async_urls', 'post'), namespace='post')),
+    path('', include('django_prometheus.urls')),
+]
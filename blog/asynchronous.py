@@ -0,0 +1,108 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.core.handlers import asgi
+from django.db import close_old_connections, connections, transaction
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+
+from blog.settings import ASYNC_DB_WORKERS
+
+READ_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Bounded pool running the ORM work of async views, it caps the number of database connections of an ASGI worker
+db_executor = ThreadPoolExecutor(max_workers=ASYNC_DB_WORKERS, thread_name_prefix='blog-db')
+
+
+def database_sync_to_async(func):
+    """
+    Run ``func`` on ``db_executor``. Connections are thread local, so the ones
+    past CONN_MAX_AGE are closed around the call like a request would, and the
+    ones used by the call are health checked again (blog.db.HealthCheckMixin).
+    """
+    def run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(run, thread_sensitive=False, executor=db_executor)
+
+
+def atomic_requests(view):
+    for db in connections.all():
+        if db.settings_dict['ATOMIC_REQUESTS']:
+            view = transaction.atomic(using=db.alias)(view)
+    return view
+
+
+def async_read_view(view):
+    """
+    Serve a DRF view as an async view. On reads the authentication classes with an
+    ``authenticate_async`` run on the event loop first; the view body and the
+    rendering of its response run on ``db_executor``. Writes run as a whole on the
+    executor, inside a transaction when ATOMIC_REQUESTS is set.
+    """
+    atomic_view = atomic_requests(view)
+    authenticators = [auth() for auth in view.cls.authentication_classes if hasattr(auth, 'authenticate_async')]
+
+    def render(func, request, *args, **kwargs):
+        response = func(request, *args, **kwargs)
+        if callable(getattr(response, 'render', None)):
+            response.render()
+        return response
+
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in READ_METHODS:
+            return await database_sync_to_async(render)(atomic_view, request, *args, **kwargs)
+
+        for authenticator in authenticators:
+            try:
+                request.jwt_authentication = await authenticator.authenticate_async(request)
+            except AuthenticationFailed:
+                # The view authenticates again and renders the error response
+                pass
+        return await database_sync_to_async(render)(view, request, *args, **kwargs)
+
+    # ATOMIC_REQUESTS can't wrap a coroutine, writes get their transaction on the executor thread
+    for alias in connections:
+        wrapper = transaction.non_atomic_requests(using=alias)(wrapper)
+    return wrapper
+
+
+class AsyncStreamingHttpResponse(StreamingHttpResponse):
+    """
+    Streaming response over an async iterator of bytes. Django 3.2 iterates the content of
+    streaming responses on the event loop, where the ORM can't run: ASGIHandler sends this
+    one with ``async for`` instead, the iterator awaits its queries on db_executor.
+    """
+
+    def __init__(self, async_streaming_content, *args, **kwargs):
+        super().__init__((), *args, **kwargs)
+        self.async_streaming_content = async_streaming_content
+
+    def __aiter__(self):
+        return self.async_streaming_content.__aiter__()
+
+
+class ASGIHandler(asgi.ASGIHandler):
+    """Django's ASGI handler, sending the body of AsyncStreamingHttpResponse as it is produced."""
+
+    async def send_response(self, response, send):
+        if not isinstance(response, AsyncStreamingHttpResponse):
+            await super().send_response(response, send)
+            return
+
+        headers = [(header.encode('ascii'), value.encode('latin1')) for header, value in response.items()]
+        headers.extend((b'Set-Cookie', cookie.output(header='').encode('ascii').strip()) for cookie in response.cookies.values())
+        await send({'type': 'http.response.start', 'status': response.status_code, 'headers': headers})
+        try:
+            async for part in response:
+                for chunk, _ in self.chunk_bytes(part):
+                    await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+            await send({'type': 'http.response.body'})
+        finally:
+            await sync_to_async(response.close, thread_sensitive=True)()
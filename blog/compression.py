@@ -0,0 +1,158 @@
+import asyncio
+import gzip
+import hashlib
+import io
+import re
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.decorators import sync_and_async_middleware
+
+from blog.metrics import compression_bytes, compression_responses
+from blog.settings import (COMPRESSION_CACHE_BACKEND, COMPRESSION_CACHE_TTL, COMPRESSION_ENCODINGS, COMPRESSION_LEVELS,
+                           COMPRESSION_MIN_SIZE)
+
+try:
+    import brotli
+except ImportError:  # optional, 'br' is skipped without it
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # optional, 'zstd' is skipped without it
+    zstandard = None
+
+COMPRESSIBLE_CONTENT_TYPE_RE = re.compile(r'^(text/|application/(json|x-ndjson|javascript|xml)|[^;]*\+(json|xml))')
+QUALITY_RE = re.compile(r'q=([0-9.]+)')
+
+
+def compress_gzip(content, level):
+    # No timestamp in the header, the same content always compresses to the same bytes
+    buffer = io.BytesIO()
+    with gzip.GzipFile(mode='wb', compresslevel=level, fileobj=buffer, mtime=0) as gzip_file:
+        gzip_file.write(content)
+    return buffer.getvalue()
+
+
+def compress_brotli(content, level):
+    return brotli.compress(content, quality=level)
+
+
+def compress_zstd(content, level):
+    return zstandard.ZstdCompressor(level=level).compress(content)
+
+
+COMPRESSORS = {'gzip': compress_gzip}
+if brotli is not None:
+    COMPRESSORS['br'] = compress_brotli
+if zstandard is not None:
+    COMPRESSORS['zstd'] = compress_zstd
+
+# Content codings served, in order of preference
+ENCODINGS = [encoding for encoding in COMPRESSION_ENCODINGS if encoding in COMPRESSORS]
+
+
+def choose_encoding(accept_encoding):
+    """The encoding of ENCODINGS with the highest q in ``accept_encoding``, the first one on ties, None when none is accepted."""
+    accepted = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        match = QUALITY_RE.search(params)
+        try:
+            accepted[coding.strip().lower()] = float(match.group(1)) if match else 1.0
+        except ValueError:
+            continue
+
+    best, best_quality = None, 0
+    for encoding in ENCODINGS:
+        quality = accepted.get(encoding, accepted.get('*', 0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def cache_compressed(response):
+    """Flag a response whose payload came from a cache, its compressed bodies are kept in COMPRESSION_CACHE_BACKEND."""
+    response.cache_compressed = True
+    return response
+
+
+def compress(content, encoding, level, cacheable):
+    """Compressed ``content`` and where it came from: 'hit' or 'miss' of the compression cache, or 'none'."""
+    if not cacheable or not COMPRESSION_CACHE_BACKEND:
+        return COMPRESSORS[encoding](content, level), 'none'
+
+    # Keyed by the content itself, a payload that changed never gets the bytes of the previous one
+    cache = caches[COMPRESSION_CACHE_BACKEND]
+    key = f'compressed:{encoding}:{level}:{hashlib.md5(content).hexdigest()}'
+    compressed = cache.get(key)
+    if compressed is not None:
+        return compressed, 'hit'
+
+    compressed = COMPRESSORS[encoding](content, level)
+    cache.set(key, compressed, COMPRESSION_CACHE_TTL)
+    return compressed, 'miss'
+
+
+def get_encoding(request, response):
+    """Encoding to compress ``response`` with, None when it is left as it is."""
+    if response.streaming or response.has_header('Content-Encoding') or len(response.content) < COMPRESSION_MIN_SIZE:
+        return None
+    if not COMPRESSIBLE_CONTENT_TYPE_RE.match(response.get('Content-Type', '')):
+        return None
+
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+
+
+def apply_encoding(response, encoding, compressed, source):
+    if len(compressed) >= len(response.content):
+        return response
+
+    compression_responses.labels(encoding, source).inc()
+    compression_bytes.labels(encoding, 'identity').inc(len(response.content))
+    compression_bytes.labels(encoding, 'compressed').inc(len(compressed))
+    response.content = compressed
+    response['Content-Length'] = str(len(compressed))
+    response['Content-Encoding'] = encoding
+    # The bytes differ from the identity ones, as GZipMiddleware does the validator becomes weak
+    etag = response.get('ETag')
+    if etag and etag.startswith('"'):
+        response['ETag'] = 'W/' + etag
+    return response
+
+
+@sync_and_async_middleware
+def compression_middleware(get_response):
+    """
+    Compress the responses of at least COMPRESSION_MIN_SIZE bytes with the preferred encoding the
+    client accepts. Bodies of the responses flagged by cache_compressed() are compressed once and
+    then read from COMPRESSION_CACHE_BACKEND. Not loaded when no encoding is available.
+    """
+    if not ENCODINGS:
+        raise MiddlewareNotUsed
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            response = await get_response(request)
+            encoding = get_encoding(request, response)
+            if encoding is None:
+                return response
+
+            # Compression takes CPU and the cache may be remote, neither runs on the event loop
+            compressed, source = await sync_to_async(compress, thread_sensitive=False)(
+                response.content, encoding, COMPRESSION_LEVELS[encoding], getattr(response, 'cache_compressed', False))
+            return apply_encoding(response, encoding, compressed, source)
+    else:
+        def middleware(request):
+            response = get_response(request)
+            encoding = get_encoding(request, response)
+            if encoding is None:
+                return response
+
+            compressed, source = compress(response.content, encoding, COMPRESSION_LEVELS[encoding], getattr(response, 'cache_compressed', False))
+            return apply_encoding(response, encoding, compressed, source)
+
+    return middleware
@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+from django.utils.decorators import sync_and_async_middleware
+from rest_framework.throttling import BaseThrottle
+
+from blog.metrics import db_replica_unavailable
+from blog.settings import DB_REPLICA_PIN_SECONDS, DB_REPLICA_RETRY_SECONDS
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+# Database of the reads of the current request, REPLICA until the router picks one. Outside of
+# requests (management commands, shell) and in writes everything goes to the primary.
+REPLICA = 'replica'
+read_database = ContextVar('read_database', default=DEFAULT_DB_ALIAS)
+
+
+class HealthCheckMixin:
+    """
+    CONN_HEALTH_CHECKS of Django 4.1 for a Django 3.2 DatabaseWrapper. A persistent connection is
+    pinged once per request, when the request first opens a cursor or a transaction on it, and
+    closed when it stopped answering (database restart, idle timeout of a proxy) so the query
+    reconnects instead of failing. Requests served from the caches never reach the database.
+    """
+    health_check_done = False
+
+    def connect(self):
+        # A new connection needs no ping, not even from the set_autocommit of connect itself
+        self.health_check_done = True
+        super().connect()
+
+    def close_if_unusable_or_obsolete(self):
+        # Runs at the start and end of every request, and around every db_executor call
+        self.health_check_done = False
+        super().close_if_unusable_or_obsolete()
+
+    def close_if_health_check_failed(self):
+        if self.connection is None or self.health_check_done or not self.settings_dict.get('CONN_HEALTH_CHECKS'):
+            return
+        # Closing the connection would drop the transaction in progress
+        if self.autocommit and not self.in_atomic_block and not self.is_usable():
+            self.close()
+        self.health_check_done = True
+
+    def _cursor(self, name=None):
+        self.close_if_health_check_failed()
+        return super()._cursor(name)
+
+    def set_autocommit(self, autocommit, force_begin_transaction_with_broken_autocommit=False):
+        self.close_if_health_check_failed()
+        return super().set_autocommit(autocommit, force_begin_transaction_with_broken_autocommit)
+
+
+def get_replicas():
+    return [alias for alias in connections if alias != DEFAULT_DB_ALIAS]
+
+
+class ReplicaRouter:
+    """
+    Send the reads of safe requests to a replica (see replica_pin_middleware), one per
+    request, and everything else to the primary. A replica that can't be connected to
+    is skipped for DB_REPLICA_RETRY_SECONDS.
+    """
+
+    def __init__(self):
+        self.replicas = get_replicas()
+        self.unavailable_until = {}
+
+    def db_for_read(self, model, **hints):
+        database = read_database.get()
+        if database == REPLICA:
+            database = self.choose_replica()
+            read_database.set(database)
+        return database
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication
+        return db == DEFAULT_DB_ALIAS
+
+    def choose_replica(self):
+        replicas = [alias for alias in self.replicas if self.unavailable_until.get(alias, 0) <= time.monotonic()]
+        random.shuffle(replicas)
+        for alias in replicas:
+            try:
+                connections[alias].ensure_connection()
+            except DatabaseError:
+                self.unavailable_until[alias] = time.monotonic() + DB_REPLICA_RETRY_SECONDS
+                db_replica_unavailable.labels(alias).inc()
+                continue
+            return alias
+        return DEFAULT_DB_ALIAS
+
+
+def pin_keys(request):
+    """
+    Keys of the client: its address (the client IP of the throttles) and its JWT when sent. Signup
+    and login are anonymous writes, the requests following them carry a token from the same address.
+    """
+    clients = [BaseThrottle().get_ident(request), request.META.get('HTTP_AUTHORIZATION')]
+    return ['db_pin:' + hashlib.md5(client.encode()).hexdigest() for client in clients if client]
+
+
+def get_read_database(request):
+    if request.method in SAFE_METHODS and not cache.get_many(pin_keys(request)):
+        return REPLICA
+    return DEFAULT_DB_ALIAS
+
+
+def pin_to_primary(request):
+    if request.method not in SAFE_METHODS:
+        cache.set_many(dict.fromkeys(pin_keys(request), True), DB_REPLICA_PIN_SECONDS)
+
+
+def reads_from_replica():
+    """Whether the reads of the current request go to a replica, which may lag behind the primary."""
+    return read_database.get() != DEFAULT_DB_ALIAS
+
+
+@sync_and_async_middleware
+def replica_pin_middleware(get_response):
+    """
+    Let the safe requests read from a replica, unless the same client (its address or its
+    JWT) wrote less than DB_REPLICA_PIN_SECONDS ago: it then reads from the primary and
+    sees its own writes.
+    """
+    if not get_replicas():
+        return get_response
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            token = read_database.set(await sync_to_async(get_read_database, thread_sensitive=False)(request))
+            try:
+                response = await get_response(request)
+            finally:
+                read_database.reset(token)
+            await sync_to_async(pin_to_primary, thread_sensitive=False)(request)
+            return response
+    else:
+        def middleware(request):
+            token = read_database.set(get_read_database(request))
+            try:
+                response = get_response(request)
+            finally:
+                read_database.reset(token)
+            pin_to_primary(request)
+            return response
+
+    return middleware
@@ -1,13 +1,21 @@
+import math
+
+from rest_framework.exceptions import Throttled
 from rest_framework.views import exception_handler
 
 
+def format_errors(errors):
+    """Flatten serializer errors (field name -> messages) to the list of messages returned by the API."""
+    return [{"message": str(errors[field_name][0]).replace('(field_name)', field_name)} for field_name in errors.keys()]
+
+
 def custom_exception_handler(exc, context):
     response = exception_handler(exc, context)
 
     if response is not None and response.status_code == 400:
-        response_data = []
-        for field_name in response.data.keys():
-            response_data.append({"message": str(response.data[field_name][0]).replace('(field_name)', field_name)})
-        response.data = response_data
+        response.data = format_errors(response.data)
+
+    if isinstance(exc, Throttled):
+        response.data = {'message': f'Muitas requisições, tente novamente em {math.ceil(exc.wait or 0)} segundos'}
 
     return response
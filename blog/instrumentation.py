@@ -0,0 +1,124 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.utils.decorators import sync_and_async_middleware
+
+from blog.metrics import (view_auth_duration, view_db_duration, view_db_queries,
+                          view_render_duration, view_serialize_duration)
+
+
+class RequestStats:
+    __slots__ = ('queries', 'db_seconds', 'auth_seconds', 'serialize_seconds', 'render_seconds', 'trace')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.auth_seconds = None
+        self.serialize_seconds = None
+        self.render_seconds = None
+        # (sql, seconds) of each query, only collected when a list is set (blog.profiling)
+        self.trace = None
+
+
+# Stats of the current request, shared with the threads running its ORM work (contexts are copied by sync_to_async)
+request_stats = ContextVar('request_stats', default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    stats = request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - start
+        stats.queries += 1
+        stats.db_seconds += elapsed
+        if stats.trace is not None:
+            stats.trace.append((sql, elapsed))
+
+
+def install_query_recorder(connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_query)
+
+
+# Connections are thread local, the ones opened by executor threads get the recorder when created
+connection_created.connect(install_query_recorder)
+
+
+@contextmanager
+def timed(field):
+    """Add the time spent in the block to ``field`` of the current request stats."""
+    stats = request_stats.get()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stats is not None:
+            setattr(stats, field, (getattr(stats, field) or 0) + time.perf_counter() - start)
+
+
+def get_view_name(request):
+    """ViewSet.action of DRF views, the URL name otherwise; None when no view was resolved."""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+
+    cls = getattr(match.func, 'cls', None)
+    if cls is None:
+        return match.view_name or 'unknown'
+
+    actions = getattr(match.func, 'actions', None) or {}
+    return f'{cls.__name__}.{actions.get(request.method.lower(), request.method.lower())}'
+
+
+def observe(request, stats):
+    view = get_view_name(request)
+    if view is None:
+        return
+
+    view_db_queries.labels(view).observe(stats.queries)
+    view_db_duration.labels(view).observe(stats.db_seconds)
+    if stats.auth_seconds is not None:
+        view_auth_duration.labels(view).observe(stats.auth_seconds)
+    if stats.serialize_seconds is not None:
+        view_serialize_duration.labels(view).observe(stats.serialize_seconds)
+    if stats.render_seconds is not None:
+        view_render_duration.labels(view).observe(stats.render_seconds)
+
+
+@sync_and_async_middleware
+def instrumentation_middleware(get_response):
+    """Record the query count, database, authentication, serialization and render time of each request by view."""
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            stats = RequestStats()
+            token = request_stats.set(stats)
+            try:
+                response = await get_response(request)
+            finally:
+                request_stats.reset(token)
+            observe(request, stats)
+            return response
+    else:
+        def middleware(request):
+            for connection in connections.all():
+                install_query_recorder(connection)
+
+            stats = RequestStats()
+            token = request_stats.set(stats)
+            try:
+                response = get_response(request)
+            finally:
+                request_stats.reset(token)
+            observe(request, stats)
+            return response
+
+    return middleware
@@ -0,0 +1,81 @@
+from django_prometheus.conf import NAMESPACE
+from prometheus_client import Counter, Histogram
+
+jwt_cache_lookups = Counter(
+    'blog_jwt_cache_lookups_total',
+    'Lookups of verified JWT payloads in the local token cache, by result (hit or miss).',
+    ['result'],
+    namespace=NAMESPACE,
+)
+
+post_cache_lookups = Counter(
+    'blog_post_cache_lookups_total',
+    'Lookups of serialized post responses in the post cache, by endpoint and result (hit or miss).',
+    ['endpoint', 'result'],
+    namespace=NAMESPACE,
+)
+
+db_replica_unavailable = Counter(
+    'blog_db_replica_unavailable_total',
+    'Connections to a read replica that failed, its reads went to the primary until the retry delay passed.',
+    ['alias'],
+    namespace=NAMESPACE,
+)
+
+throttle_requests = Counter(
+    'blog_throttle_requests_total',
+    'Requests checked against a throttle bucket, by scope and result (allowed or throttled).',
+    ['scope', 'result'],
+    namespace=NAMESPACE,
+)
+
+compression_responses = Counter(
+    'blog_compression_responses_total',
+    'Compressed responses, by encoding and source of the compressed body (hit or miss of the compression cache, none when not cached).',
+    ['encoding', 'cache'],
+    namespace=NAMESPACE,
+)
+
+compression_bytes = Counter(
+    'blog_compression_bytes_total',
+    'Body bytes of the compressed responses, by encoding, before (identity) and after (compressed) compression.',
+    ['encoding', 'stage'],
+    namespace=NAMESPACE,
+)
+
+# Per request, labelled by view (ViewSet.action), see blog.instrumentation
+view_db_queries = Histogram(
+    'blog_view_db_queries',
+    'Database queries run by a request, by view.',
+    ['view'],
+    namespace=NAMESPACE,
+    buckets=(0, 1, 2, 3, 4, 5, 7, 10, 15, 20, 30, 50, 100, float('inf')),
+)
+
+view_db_duration = Histogram(
+    'blog_view_db_duration_seconds',
+    'Time spent in database queries by a request, by view.',
+    ['view'],
+    namespace=NAMESPACE,
+)
+
+view_render_duration = Histogram(
+    'blog_view_render_duration_seconds',
+    'Time spent rendering the serialized data of a response, by view.',
+    ['view'],
+    namespace=NAMESPACE,
+)
+
+view_serialize_duration = Histogram(
+    'blog_view_serialize_duration_seconds',
+    'Time spent serializing the rows or instances of a response to its data, by view.',
+    ['view'],
+    namespace=NAMESPACE,
+)
+
+view_auth_duration = Histogram(
+    'blog_view_auth_duration_seconds',
+    'Time spent authenticating the JWT of a request, by view.',
+    ['view'],
+    namespace=NAMESPACE,
+)
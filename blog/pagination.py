@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from blog.settings import MAX_PAGE_SIZE, PAGE_SIZE
+
+
+class BlogCursorPagination(CursorPagination):
+    page_size = PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
+
+
+class PostCursorPagination(BlogCursorPagination):
+    ordering = ('-published', '-id')
+
+
+class UserCursorPagination(BlogCursorPagination):
+    ordering = ('id',)
+
+
+class SearchPagination(PageNumberPagination):
+    page_size = PAGE_SIZE
+    page_size_query_param = 'page_size'
+    max_page_size = MAX_PAGE_SIZE
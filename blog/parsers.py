@@ -0,0 +1,36 @@
+import codecs
+import io
+import re
+
+from django.conf import settings
+from rest_framework import parsers
+
+try:
+    import orjson
+except ImportError:  # optional, see API_JSON in the settings
+    orjson = None
+
+# orjson reads integers over 64 bits as floats, bodies with that many digits in a row are left to the stdlib
+LONG_NUMBER_RE = re.compile(rb'[0-9]{19}')
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    JSONParser on orjson. Bodies in other charsets than UTF-8, with long numbers or that
+    orjson rejects go through the stdlib parser, which returns the same data or error
+    as without orjson.
+    """
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        encoding = (parser_context or {}).get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != 'utf-8':
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if LONG_NUMBER_RE.search(body):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
+
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(io.BytesIO(body), media_type, parser_context)
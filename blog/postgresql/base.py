@@ -0,0 +1,7 @@
+from django.db.backends.postgresql import base
+
+from blog.db import HealthCheckMixin
+
+
+class DatabaseWrapper(HealthCheckMixin, base.DatabaseWrapper):
+    """PostgreSQL backend pinging persistent connections before their first use in a request."""
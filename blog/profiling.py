@@ -0,0 +1,133 @@
+import asyncio
+import cProfile
+import json
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.decorators import sync_and_async_middleware
+
+from blog.instrumentation import get_view_name, request_stats
+from blog.settings import PROFILING_DIR, PROFILING_MAX_CAPTURES, PROFILING_SAMPLE_RATE, PROFILING_SLOW_MS
+
+# Names of the captures, sortable by creation time
+CAPTURE_NAME_RE = r'[0-9]{8}T[0-9]{12}-[0-9a-f]{8}'
+
+
+class ProfileStore:
+    """
+    Captures on disk: ``<name>.json`` holds the request, its timings and SQL trace,
+    ``<name>.prof`` the cProfile stats of sampled requests (pstats or snakeviz
+    read them). Only the ``max_captures`` newest are kept.
+    """
+
+    def __init__(self, directory, max_captures):
+        self.directory = Path(directory)
+        self.max_captures = max_captures
+
+    def save(self, capture, profile=None):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        name = f'{datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")}-{uuid.uuid4().hex[:8]}'
+
+        if profile is not None:
+            profile.dump_stats(self.path(name, 'prof'))
+        capture = {'name': name, 'profile': profile is not None, **capture}
+        self.path(name, 'json').write_text(json.dumps(capture))
+
+        self.rotate()
+        return name
+
+    def list(self):
+        """Metadata of the captures, newest first, without their SQL trace."""
+        captures = []
+        for path in sorted(self.directory.glob('*.json'), reverse=True):
+            try:
+                capture = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            capture.pop('queries', None)
+            captures.append(capture)
+        return captures
+
+    def path(self, name, ext):
+        return self.directory / f'{name}.{ext}'
+
+    def rotate(self):
+        for path in sorted(self.directory.glob('*.json'), reverse=True)[self.max_captures:]:
+            for capture_path in (path, path.with_suffix('.prof')):
+                try:
+                    capture_path.unlink()
+                except FileNotFoundError:
+                    pass
+
+
+def get_profile_store():
+    return ProfileStore(PROFILING_DIR, PROFILING_MAX_CAPTURES)
+
+
+def build_capture(request, response, seconds, trace):
+    return {
+        'created': datetime.now(timezone.utc).isoformat(),
+        'method': request.method,
+        'path': request.get_full_path(),
+        'view': get_view_name(request),
+        'status': response.status_code,
+        'duration_ms': round(seconds * 1000, 3),
+        'queries': [{'sql': sql, 'duration_ms': round(elapsed * 1000, 3)} for sql, elapsed in trace or ()],
+    }
+
+
+@sync_and_async_middleware
+def profiling_middleware(get_response):
+    """
+    Save a capture of the sampled requests and of the ones slower than PROFILING_SLOW_MS.
+    Sampled requests run under cProfile; under ASGI the views run on executor threads
+    that cProfile can't follow, so their captures only hold timings and SQL. Not loaded
+    at all when both settings are 0. The SQL trace needs blog.instrumentation.instrumentation_middleware.
+    """
+    if not PROFILING_SAMPLE_RATE and not PROFILING_SLOW_MS:
+        raise MiddlewareNotUsed
+
+    store = get_profile_store()
+
+    def start_trace():
+        stats = request_stats.get()
+        if stats is None:
+            return None
+        stats.trace = []
+        return stats.trace
+
+    def should_save(sampled, seconds):
+        return sampled or (PROFILING_SLOW_MS and seconds * 1000 >= PROFILING_SLOW_MS)
+
+    if asyncio.iscoroutinefunction(get_response):
+        async def middleware(request):
+            sampled = random.random() < PROFILING_SAMPLE_RATE
+            trace = start_trace()
+            start = time.perf_counter()
+            response = await get_response(request)
+            seconds = time.perf_counter() - start
+
+            if should_save(sampled, seconds):
+                await sync_to_async(store.save, thread_sensitive=False)(build_capture(request, response, seconds, trace))
+            return response
+    else:
+        def middleware(request):
+            profile = cProfile.Profile() if random.random() < PROFILING_SAMPLE_RATE else None
+            trace = start_trace()
+            start = time.perf_counter()
+            if profile is not None:
+                response = profile.runcall(get_response, request)
+            else:
+                response = get_response(request)
+            seconds = time.perf_counter() - start
+
+            if should_save(profile is not None, seconds):
+                store.save(build_capture(request, response, seconds, trace), profile)
+            return response
+
+    return middleware
@@ -0,0 +1,62 @@
+from types import SimpleNamespace
+
+from rest_framework import serializers
+
+# Fields whose representation of a database value is the value itself
+COPIED_FIELDS = (serializers.CharField, serializers.EmailField, serializers.IntegerField, serializers.BooleanField)
+
+
+class RowSerializer:
+    """
+    Read only counterpart of a ModelSerializer instance working on ``.values()`` rows: same
+    representation, without building model instances nor going through DRF's per field machinery.
+    ``columns`` are the ones to select. Plain columns are copied, other fields go through their
+    ``to_representation`` and nested serializers read the columns of their relation (``user__email``).
+    A SerializerMethodField is given an object carrying the columns its serializer lists for it in
+    ``row_sources``.
+    """
+
+    def __init__(self, serializer, prefix=''):
+        self.columns = []
+        # (field name, column or None when ``convert`` takes the whole row, convert)
+        self.fields = []
+
+        for field_name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if isinstance(field, serializers.BaseSerializer):
+                self.add_nested(field_name, RowSerializer(field, f'{prefix}{field.source}__'), f'{prefix}{field.source}__id')
+            elif isinstance(field, serializers.SerializerMethodField):
+                self.add_method(field_name, field, {source: prefix + source for source in serializer.row_sources[field_name]})
+            else:
+                column = prefix + '__'.join(field.source_attrs)
+                self.columns.append(column)
+                self.fields.append((field_name, column, None if type(field) in COPIED_FIELDS else field.to_representation))
+
+    def add_nested(self, field_name, nested, pk_column):
+        def convert(row):
+            return None if row[pk_column] is None else nested.to_representation(row)
+
+        self.columns.extend(column for column in (pk_column, *nested.columns) if column not in self.columns)
+        self.fields.append((field_name, None, convert))
+
+    def add_method(self, field_name, field, columns):
+        def convert(row):
+            return field.to_representation(SimpleNamespace(**{source: row[column] for source, column in columns.items()}))
+
+        self.columns.extend(columns.values())
+        self.fields.append((field_name, None, convert))
+
+    def to_representation(self, row):
+        ret = {}
+        for field_name, column, convert in self.fields:
+            if column is None:
+                ret[field_name] = convert(row)
+            else:
+                value = row[column]
+                ret[field_name] = value if convert is None or value is None else convert(value)
+        return ret
+
+    def serialize(self, rows):
+        return [self.to_representation(row) for row in rows]
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import importlib.util
 import os
 from pathlib import Path
 
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'django_prometheus',
     'rest_framework',
 
@@ -48,6 +50,10 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django_prometheus.middleware.PrometheusBeforeMiddleware',
+    'blog.instrumentation.instrumentation_middleware',
+    'blog.profiling.profiling_middleware',
+    'blog.compression.compression_middleware',
+    'blog.db.replica_pin_middleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -58,7 +64,8 @@ MIDDLEWARE = [
     'django_prometheus.middleware.PrometheusAfterMiddleware',
 ]
 
-ROOT_URLCONF = 'blog.urls'
+# blog.asgi defaults to blog.asgi_urls, where the read endpoints are async views
+ROOT_URLCONF = os.environ.get('ROOT_URLCONF', 'blog.urls')
 
 TEMPLATES = [
     {
@@ -79,8 +86,20 @@ TEMPLATES = [
 WSGI_APPLICATION = 'blog.wsgi.application'
 
 
+# JSON of the API requests and responses: 'orjson' (default when the package is installed, same bytes as the stdlib) or 'json'
+API_JSON = os.environ.get('API_JSON', 'orjson' if importlib.util.find_spec('orjson') else 'json')
+
 REST_FRAMEWORK = {
     'EXCEPTION_HANDLER': 'blog.exception.custom_exception_handler',
+    'DEFAULT_RENDERER_CLASSES': (
+        'blog.renderers.ORJSONRenderer' if API_JSON == 'orjson' else 'blog.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'blog.parsers.ORJSONParser' if API_JSON == 'orjson' else 'rest_framework.parsers.JSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
@@ -88,11 +107,39 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.TokenAuthentication',
         'user.authentication.JWTCustomAuthentication',
     ),
+    # Proxies in front of the app, X-Forwarded-For is only trusted for that many hops (client IP of the throttles).
+    # Without proxies it is ignored, anyone can send one to get a new throttle bucket on every request.
+    'NUM_PROXIES': int(os.environ.get('NUM_PROXIES') or 0),
+}
+
+# Token buckets of /user/login and POST /user, keyed by client IP and by the email in the request body.
+# A rate 'n/period' allows bursts of n requests and refills them over the period. THROTTLE_BACKEND names
+# an entry of CACHES sharing the buckets between workers, otherwise THROTTLE_CACHE_SIZE buckets are kept locally.
+THROTTLE_BACKEND = os.environ.get('THROTTLE_BACKEND')
+THROTTLE_CACHE_SIZE = int(os.environ.get('THROTTLE_CACHE_SIZE', 10000))
+THROTTLE_RATES = {
+    'login': os.environ.get('THROTTLE_LOGIN_RATE', '20/min'),
+    'login_email': os.environ.get('THROTTLE_LOGIN_EMAIL_RATE', '5/min'),
+    'signup': os.environ.get('THROTTLE_SIGNUP_RATE', '10/hour'),
 }
 
+# Cursor pagination of the list endpoints, ``page_size`` query param is capped by MAX_PAGE_SIZE
+PAGE_SIZE = int(os.environ.get('PAGE_SIZE', 20))
+MAX_PAGE_SIZE = int(os.environ.get('MAX_PAGE_SIZE', 100))
+
 
 SECRET_JWT = os.environ.get('SECRET_JWT', 'secret_for_jwt')
 
+# Users resolved from a JWT are kept in a local LRU (AUTH_USER_CACHE_SIZE=0 disables it).
+# AUTH_USER_CACHE_BACKEND optionally names an entry of CACHES shared between workers.
+AUTH_USER_CACHE_SIZE = int(os.environ.get('AUTH_USER_CACHE_SIZE', 1024))
+AUTH_USER_CACHE_TTL = int(os.environ.get('AUTH_USER_CACHE_TTL', 60))
+AUTH_USER_CACHE_BACKEND = os.environ.get('AUTH_USER_CACHE_BACKEND')
+
+# Verified JWT payloads are kept in a local LRU until they expire (JWT_CACHE_SIZE=0 disables it)
+JWT_CACHE_SIZE = int(os.environ.get('JWT_CACHE_SIZE', 4096))
+JWT_CACHE_TTL = int(os.environ.get('JWT_CACHE_TTL', 3600))
+
 
 # Database
 # https://docs.djangoproject.com/en/3.2/ref/settings/#databases
@@ -106,16 +153,31 @@ DB_NAME = os.environ.get('DB_NAME')
 DB_USER = os.environ.get('DB_USER')
 DB_PASSWORD = os.environ.get('DB_PASSWORD')
 
+# Connections are kept open for DB_CONN_MAX_AGE seconds (0 closes them at the end of each request,
+# empty keeps them forever) and, when DB_CONN_HEALTH_CHECKS is set, pinged by the blog.postgresql backend
+# the first time each request uses them.
+# DB_PGBOUNCER=true when connecting through PgBouncer in transaction pooling mode: server side cursors
+# don't survive between transactions there, so querysets iterated with .iterator() fetch client side.
+DB_CONN_MAX_AGE = os.environ.get('DB_CONN_MAX_AGE', '60')
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'true').lower() == 'true'
+DB_PGBOUNCER = os.environ.get('DB_PGBOUNCER', 'false').lower() == 'true'
+DB_CONNECTION = {
+    'CONN_MAX_AGE': int(DB_CONN_MAX_AGE) if DB_CONN_MAX_AGE else None,
+    'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
+    'DISABLE_SERVER_SIDE_CURSORS': DB_PGBOUNCER,
+}
+
 if all([DB_HOST, DB_PORT, DB_NAME, DB_USER]):
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql_psycopg2',
+            'ENGINE': 'blog.postgresql',
             'HOST': DB_HOST,
             'PORT': DB_PORT,
             'NAME': DB_NAME,
             'USER': DB_USER,
             'PASSWORD': DB_PASSWORD,
             # 'ATOMIC_REQUESTS': True
+            **DB_CONNECTION,
         }
     }
 else:
@@ -125,16 +187,112 @@ else:
     # Fallback settings
     DATABASES = {
         'default': {
-            'ENGINE': 'django.db.backends.postgresql_psycopg2',
+            'ENGINE': 'blog.postgresql',
             'NAME': 'blogapi',
             'USER': 'blogapi',
             'PASSWORD': 'blogapi',
             'HOST': '127.0.0.1',
             'PORT': '5432',
             'ATOMIC_REQUESTS': True,
+            **DB_CONNECTION,
         }
     }
 
+# Reads of GET/HEAD/OPTIONS requests go to the replicas in DB_REPLICA_HOSTS (comma separated host[:port], same
+# DB_NAME/DB_USER/DB_PASSWORD as the primary). A client (address and JWT) is pinned to the primary for
+# DB_REPLICA_PIN_SECONDS after each of its writes, and posts read from a replica are not cached for that long
+# after a write to the posts. An unreachable replica is skipped for DB_REPLICA_RETRY_SECONDS.
+DB_REPLICA_HOSTS = [host for host in os.environ.get('DB_REPLICA_HOSTS', '').split(',') if host]
+DB_REPLICA_PIN_SECONDS = int(os.environ.get('DB_REPLICA_PIN_SECONDS', 5))
+DB_REPLICA_RETRY_SECONDS = int(os.environ.get('DB_REPLICA_RETRY_SECONDS', 30))
+
+for index, replica_host in enumerate(DB_REPLICA_HOSTS):
+    replica_host, _, replica_port = replica_host.partition(':')
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host,
+        'PORT': replica_port or DATABASES['default']['PORT'],
+        'ATOMIC_REQUESTS': False,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+DATABASE_ROUTERS = ['blog.db.ReplicaRouter']
+
+
+# User avatars uploaded as data URIs are moved to this storage and served by GET /user/avatar/<name>.
+# Any django Storage class works, e.g. storages.backends.s3boto3.S3Boto3Storage with AVATAR_LOCATION as key prefix
+
+AVATAR_STORAGE = os.environ.get('AVATAR_STORAGE', 'django.core.files.storage.FileSystemStorage')
+AVATAR_STORAGE_OPTIONS = {
+    'location': os.environ.get('AVATAR_LOCATION', str(BASE_DIR / 'media' / 'avatars')),
+}
+AVATAR_MAX_BYTES = int(os.environ.get('AVATAR_MAX_BYTES', 1024 * 1024))
+
+
+# Opt-in request profiling, see blog.profiling. A PROFILING_SAMPLE_RATE fraction (0 to 1) of the requests
+# run under cProfile, requests slower than PROFILING_SLOW_MS get their SQL trace saved. Only the
+# PROFILING_MAX_CAPTURES newest captures are kept in PROFILING_DIR, staff users browse them at /admin/profiles/
+PROFILING_SAMPLE_RATE = float(os.environ.get('PROFILING_SAMPLE_RATE', 0))
+PROFILING_SLOW_MS = int(os.environ.get('PROFILING_SLOW_MS', 0))
+PROFILING_DIR = os.environ.get('PROFILING_DIR', str(BASE_DIR / 'media' / 'profiles'))
+PROFILING_MAX_CAPTURES = int(os.environ.get('PROFILING_MAX_CAPTURES', 200))
+
+
+# Threads of an ASGI worker running the ORM work of async views, at most one database connection each
+ASYNC_DB_WORKERS = int(os.environ.get('ASYNC_DB_WORKERS', 16))
+
+
+# Cache
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+# Local memory by default, point CACHE_BACKEND/CACHE_LOCATION to a shared cache in production,
+# e.g. django_redis.cache.RedisCache and redis://redis:6379/1
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    }
+}
+
+# Serialized responses of GET /post, /post/<pk> and /post/search
+POST_CACHE_BACKEND = os.environ.get('POST_CACHE_BACKEND', 'default')
+POST_CACHE_TTL = int(os.environ.get('POST_CACHE_TTL', 300))
+
+# Responses of at least COMPRESSION_MIN_SIZE bytes are compressed with the first of COMPRESSION_ENCODINGS the client
+# accepts (empty disables compression), 'br' needs the brotli package and 'zstd' the zstandard one (skipped when
+# not installed). Compressed bodies of the responses served from the post cache are kept in COMPRESSION_CACHE_BACKEND
+# (empty disables it), see benchmarks/compression.py for the size and CPU cost of each encoding and level.
+COMPRESSION_ENCODINGS = [encoding for encoding in os.environ.get('COMPRESSION_ENCODINGS', 'br,zstd,gzip').split(',') if encoding]
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_LEVELS = {
+    'gzip': int(os.environ.get('COMPRESSION_GZIP_LEVEL', 6)),
+    'br': int(os.environ.get('COMPRESSION_BROTLI_LEVEL', 4)),
+    'zstd': int(os.environ.get('COMPRESSION_ZSTD_LEVEL', 3)),
+}
+COMPRESSION_CACHE_BACKEND = os.environ.get('COMPRESSION_CACHE_BACKEND', POST_CACHE_BACKEND)
+COMPRESSION_CACHE_TTL = int(os.environ.get('COMPRESSION_CACHE_TTL', POST_CACHE_TTL))
+
+# Length of the ``excerpt`` of posts rendered with ?view=summary
+POST_EXCERPT_LENGTH = int(os.environ.get('POST_EXCERPT_LENGTH', 200))
+
+# Maximum number of posts accepted by a single request to /post/bulk
+BULK_MAX_ITEMS = int(os.environ.get('BULK_MAX_ITEMS', 100))
+
+# Rows fetched per round trip by GET /post/export (server side cursor, keyset pages under blog.asgi)
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/3.2/topics/auth/passwords/
+# PASSWORD_HASH_ITERATIONS sets the CPU cost of each login (see benchmarks/login.py),
+# passwords hashed with another count are rehashed on their next successful login.
+
+PASSWORD_HASH_ITERATIONS = int(os.environ.get('PASSWORD_HASH_ITERATIONS', 260000))
+PASSWORD_HASHERS = [
+    'user.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
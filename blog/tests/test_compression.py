@@ -0,0 +1,27 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from blog.compression import choose_encoding
+
+
+class ChooseEncodingTestCase(SimpleTestCase):
+    @mock.patch('blog.compression.ENCODINGS', ['br', 'zstd', 'gzip'])
+    def test_preference(self):
+        self.assertEqual(choose_encoding('gzip, deflate, br'), 'br')
+        self.assertEqual(choose_encoding('gzip, zstd'), 'zstd')
+        self.assertEqual(choose_encoding('GZIP'), 'gzip')
+        self.assertEqual(choose_encoding('*'), 'br')
+
+    @mock.patch('blog.compression.ENCODINGS', ['br', 'zstd', 'gzip'])
+    def test_quality(self):
+        self.assertEqual(choose_encoding('br;q=0.5, gzip'), 'gzip')
+        self.assertEqual(choose_encoding('br;q=0, *;q=0.1'), 'zstd')
+        self.assertEqual(choose_encoding('gzip;q=0'), None)
+        self.assertEqual(choose_encoding('gzip;q=abc, br'), 'br')
+
+    @mock.patch('blog.compression.ENCODINGS', ['gzip'])
+    def test_not_accepted(self):
+        self.assertEqual(choose_encoding(''), None)
+        self.assertEqual(choose_encoding('identity'), None)
+        self.assertEqual(choose_encoding('br'), None)
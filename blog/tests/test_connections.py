@@ -0,0 +1,100 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from blog.db import HealthCheckMixin
+
+
+class BaseDatabaseWrapper:
+    def __init__(self, health_checks=True):
+        self.settings_dict = {'CONN_HEALTH_CHECKS': health_checks}
+        self.connection = None
+        self.autocommit = True
+        self.in_atomic_block = False
+        self.is_usable = mock.Mock(return_value=True)
+
+    def connect(self):
+        self.connection = object()
+        self.set_autocommit(True)
+
+    def close(self):
+        self.connection = None
+
+    def close_if_unusable_or_obsolete(self):
+        pass
+
+    def _cursor(self, name=None):
+        if self.connection is None:
+            self.connect()
+        return mock.Mock()
+
+    def set_autocommit(self, autocommit, force_begin_transaction_with_broken_autocommit=False):
+        self.autocommit = autocommit
+
+
+class DatabaseWrapper(HealthCheckMixin, BaseDatabaseWrapper):
+    pass
+
+
+class HealthCheckTestCase(SimpleTestCase):
+    def reused(self, health_checks=True):
+        """A persistent connection at the start of a new request."""
+        wrapper = DatabaseWrapper(health_checks)
+        wrapper.connect()
+        wrapper.close_if_unusable_or_obsolete()
+        return wrapper
+
+    def test_new_connection_not_pinged(self):
+        wrapper = DatabaseWrapper()
+        wrapper._cursor()
+
+        wrapper.is_usable.assert_not_called()
+
+    def test_pinged_once_per_request(self):
+        wrapper = self.reused()
+        wrapper._cursor()
+        wrapper._cursor()
+        self.assertEqual(wrapper.is_usable.call_count, 1)
+
+        wrapper.close_if_unusable_or_obsolete()
+        wrapper.set_autocommit(False)
+        self.assertEqual(wrapper.is_usable.call_count, 2)
+
+    def test_broken_connection_closed(self):
+        wrapper = self.reused()
+        broken = wrapper.connection
+        wrapper.is_usable.return_value = False
+
+        wrapper._cursor()
+
+        wrapper.is_usable.assert_called_once_with()
+        self.assertIsNotNone(wrapper.connection)
+        self.assertIsNot(wrapper.connection, broken)
+
+    def test_connection_in_atomic_block_skipped(self):
+        wrapper = self.reused()
+        connection = wrapper.connection
+        wrapper.in_atomic_block = True
+        wrapper.is_usable.return_value = False
+
+        wrapper._cursor()
+
+        wrapper.is_usable.assert_not_called()
+        self.assertIs(wrapper.connection, connection)
+
+    def test_connection_in_transaction_skipped(self):
+        wrapper = self.reused()
+        wrapper.autocommit = False
+
+        wrapper.set_autocommit(True)
+
+        wrapper.is_usable.assert_not_called()
+
+    def test_disabled_without_flag(self):
+        wrapper = self.reused(health_checks=False)
+        wrapper.is_usable.return_value = False
+
+        wrapper._cursor()
+
+        wrapper.is_usable.assert_not_called()
+        self.assertIsNotNone(wrapper.connection)
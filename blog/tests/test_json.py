@@ -0,0 +1,90 @@
+import io
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from blog.exception import format_errors
+from blog.parsers import ORJSONParser
+from blog.renderers import JSONRenderer, ORJSONRenderer
+from post.models import Post
+from post.serializers import ListPostSerializer
+from user.models import User
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+    def assertSameBytes(self, data, accepted_media_type=None, renderer_context=None):
+        expected = JSONRenderer().render(data, accepted_media_type, renderer_context)
+        self.assertEqual(ORJSONRenderer().render(data, accepted_media_type, renderer_context), expected)
+
+    def test_list_post_payload(self):
+        user = User(id=401465483996, displayName='raphael nascimento', email='raphael@email.com', image='http://image.png',
+                    updated=datetime(2021, 8, 1, 12, 30, 15, 123456, tzinfo=timezone.utc))
+        post = [
+            Post(id=index, title=f'Últimas atualizações {index}   ', content='Conteúdo "do" post\n\t\\ 😀 \x00',
+                 user=user, published=user.updated, updated=user.updated)
+            for index in range(20)
+        ]
+
+        self.assertSameBytes(ListPostSerializer(post, many=True).data)
+
+    def test_error_payloads(self):
+        self.assertSameBytes(format_errors({'title': ['"(field_name)" is required'], 'content': ['"(field_name)" is not valid']}))
+        self.assertSameBytes({'message': 'Muitas requisições, tente novamente em 60 segundos'})
+
+    def test_python_types(self):
+        self.assertSameBytes({
+            'datetime': datetime(2021, 8, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            'naive': datetime(2021, 8, 1, 12, 30, 15),
+            'date': date(2021, 8, 1),
+            'timedelta': timedelta(minutes=5),
+            'decimal': Decimal('1.50'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Post não existe'),
+            'tuple': (1, 2),
+            'nested': [{'a': None, 'b': True, 'c': -5}],
+            1: 'int key',
+            'big': 2 ** 70,
+        })
+
+    def test_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+        self.assertSameBytes({})
+        self.assertSameBytes([])
+
+    def test_indent(self):
+        self.assertSameBytes({'message': 'Post não existe'}, 'application/json; indent=4')
+        self.assertSameBytes({'message': 'Post não existe'}, renderer_context={'indent': 2})
+
+    def test_without_orjson(self):
+        with mock.patch('blog.renderers.orjson', None):
+            self.assertSameBytes({'message': 'Post não existe'})
+
+
+class ORJSONParserTestCase(SimpleTestCase):
+    def parse(self, parser, body, encoding='utf-8'):
+        return parser.parse(io.BytesIO(body), parser_context={'encoding': encoding})
+
+    def test_same_data(self):
+        body = '{"title":"Últimas \\u00e9  ","content":"x","ids":[1,2.5,-3,100000000000000000000000],"ok":true,"none":null}'.encode()
+
+        self.assertEqual(self.parse(ORJSONParser(), body), self.parse(JSONParser(), body))
+
+    def test_same_errors(self):
+        for body in (b'{"title": ', b'{"value": NaN}', b'\xef\xbb\xbf{}', b'\xff'):
+            with self.assertRaises(ParseError) as expected:
+                self.parse(JSONParser(), body)
+            with self.assertRaises(ParseError) as context:
+                self.parse(ORJSONParser(), body)
+
+            self.assertEqual(str(context.exception.detail), str(expected.exception.detail))
+
+    def test_other_charsets(self):
+        body = '{"title": "Últimas"}'.encode('latin-1')
+
+        self.assertEqual(self.parse(ORJSONParser(), body, 'latin-1'), {'title': 'Últimas'})
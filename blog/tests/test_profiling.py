@@ -0,0 +1,98 @@
+import json
+import pstats
+import shutil
+import tempfile
+from unittest import mock
+
+from django.contrib.auth.models import User as AdminUser
+from django.core.exceptions import MiddlewareNotUsed
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from blog.profiling import ProfileStore, profiling_middleware
+from post.tests.factories import PostFactory
+from user.tests.factories import UserFactory
+from user.tests.mock import mock_authenticate_credentials_success
+
+
+class ProfilingMiddlewareTestCase(APITestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        patcher = mock.patch('blog.profiling.PROFILING_DIR', self.directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.directory)
+
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        PostFactory.create_batch(size=2, title='title', content='content', user=self.user[0])
+        self.admin = AdminUser.objects.create_superuser('admin', 'admin@email.com', 'admin')
+
+    @mock.patch('blog.profiling.PROFILING_SAMPLE_RATE', 1.0)
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_sampled_request_is_profiled(self):
+        self.client.get(reverse('post:post-list'))
+
+        self.client.force_login(self.admin)
+        captures = self.client.get(reverse('profiles')).json()['results']
+
+        self.assertEqual(len(captures), 1)
+        self.assertEqual(captures[0]['view'], 'PostViewSet.list')
+        self.assertEqual(captures[0]['status'], status.HTTP_200_OK)
+        self.assertTrue(captures[0]['profile'])
+
+        response = self.client.get(reverse('profile', kwargs={'name': captures[0]['name'], 'ext': 'json'}))
+        capture = json.loads(b''.join(response.streaming_content))
+        self.assertTrue(any('"post_post"' in query['sql'] for query in capture['queries']))
+
+        response = self.client.get(reverse('profile', kwargs={'name': captures[0]['name'], 'ext': 'prof'}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        pstats.Stats(str(ProfileStore(self.directory, 10).path(captures[0]['name'], 'prof')))
+
+    @mock.patch('blog.profiling.PROFILING_SLOW_MS', 500)
+    @mock.patch('blog.profiling.time')
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_slow_request_is_traced(self, time):
+        time.perf_counter.side_effect = [0.0, 0.1, 0.0, 0.6]
+
+        self.client.get(reverse('post:post-list'))
+        self.client.get(reverse('post:post-list'))
+
+        captures = ProfileStore(self.directory, 10).list()
+        self.assertEqual(len(captures), 1)
+        self.assertEqual(captures[0]['duration_ms'], 600)
+        self.assertFalse(captures[0]['profile'])
+
+    @mock.patch('blog.profiling.PROFILING_SAMPLE_RATE', 1.0)
+    def test_profiles_only_for_staff(self):
+        self.assertEqual(self.client.get(reverse('profiles')).status_code, status.HTTP_302_FOUND)
+
+        self.client.force_login(self.admin)
+        response = self.client.get(reverse('profile', kwargs={'name': '20260101T000000000000-0123abcd', 'ext': 'json'}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ProfileStoreTestCase(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_keeps_newest_captures(self):
+        store = ProfileStore(self.directory, max_captures=2)
+
+        names = [store.save({'path': f'/post/{index}'}) for index in range(3)]
+
+        self.assertEqual([capture['name'] for capture in store.list()], names[:0:-1])
+        self.assertFalse(store.path(names[0], 'json').exists())
+
+    def test_disabled_middleware_is_not_used(self):
+        with self.assertRaises(MiddlewareNotUsed):
+            profiling_middleware(lambda request: None)
@@ -0,0 +1,89 @@
+import contextvars
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import SimpleTestCase
+from rest_framework.test import APIRequestFactory
+
+from blog.db import REPLICA, ReplicaRouter, get_read_database, pin_to_primary, read_database
+from post.models import Post
+
+
+class ReplicaRouterTestCase(SimpleTestCase):
+    def setUp(self):
+        self.router = ReplicaRouter()
+        self.router.replicas = ['replica_0', 'replica_1']
+        self.connections = mock.MagicMock()
+        patcher = mock.patch('blog.db.connections', self.connections)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self, database, reads=1):
+        def run():
+            read_database.set(database)
+            return [self.router.db_for_read(Post) for _ in range(reads)]
+
+        return contextvars.copy_context().run(run)
+
+    def test_reads_outside_requests_use_primary(self):
+        self.assertEqual(self.router.db_for_read(Post), 'default')
+        self.connections.__getitem__.assert_not_called()
+
+    def test_request_reads_from_one_replica(self):
+        databases = self.read(REPLICA, reads=3)
+
+        self.assertIn(databases[0], ('replica_0', 'replica_1'))
+        self.assertEqual(databases, [databases[0]] * 3)
+
+    @mock.patch('blog.db.random.shuffle', lambda replicas: None)
+    def test_unavailable_replica_is_skipped(self):
+        self.connections.__getitem__.side_effect = lambda alias: {
+            'replica_0': mock.Mock(**{'ensure_connection.side_effect': OperationalError}),
+            'replica_1': mock.Mock(),
+        }[alias]
+
+        self.assertEqual(self.read(REPLICA), ['replica_1'])
+        self.assertEqual(self.router.choose_replica(), 'replica_1')
+        self.assertIn('replica_0', self.router.unavailable_until)
+
+    def test_falls_back_to_primary(self):
+        self.connections.__getitem__.return_value.ensure_connection.side_effect = OperationalError
+
+        self.assertEqual(self.read(REPLICA), ['default'])
+
+        self.connections.__getitem__.reset_mock()
+        self.assertEqual(self.read(REPLICA), ['default'])
+        self.connections.__getitem__.assert_not_called()
+
+    def test_writes_use_primary(self):
+        self.assertEqual(self.router.db_for_write(Post), 'default')
+
+    def test_migrations_only_on_primary(self):
+        self.assertTrue(self.router.allow_migrate('default', 'post'))
+        self.assertFalse(self.router.allow_migrate('replica_0', 'post'))
+
+
+class ReadYourWritesTestCase(SimpleTestCase):
+    def setUp(self):
+        self.factory = APIRequestFactory()
+
+    def test_safe_request_reads_from_replica(self):
+        request = self.factory.get('/post', HTTP_AUTHORIZATION='token')
+
+        self.assertEqual(get_read_database(request), REPLICA)
+
+    def test_client_is_pinned_after_write(self):
+        pin_to_primary(self.factory.post('/post', HTTP_AUTHORIZATION='token', REMOTE_ADDR='10.0.0.1'))
+
+        self.assertEqual(get_read_database(self.factory.get('/post', HTTP_AUTHORIZATION='token', REMOTE_ADDR='10.0.0.1')), 'default')
+        self.assertEqual(get_read_database(self.factory.get('/post', HTTP_AUTHORIZATION='token', REMOTE_ADDR='10.0.0.9')), 'default')
+        self.assertEqual(get_read_database(self.factory.get('/post', HTTP_AUTHORIZATION='another token', REMOTE_ADDR='10.0.0.2')), REPLICA)
+
+    def test_client_is_pinned_after_signup(self):
+        pin_to_primary(self.factory.post('/user', REMOTE_ADDR='10.0.0.3'))
+
+        # The token of the new user is sent from the same address
+        self.assertEqual(get_read_database(self.factory.get('/user/1', HTTP_AUTHORIZATION='new token', REMOTE_ADDR='10.0.0.3')), 'default')
+
+    def test_unsafe_request_uses_primary(self):
+        self.assertEqual(get_read_database(self.factory.put('/post/1', HTTP_AUTHORIZATION='token')), 'default')
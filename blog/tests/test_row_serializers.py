@@ -0,0 +1,60 @@
+from django.test import TestCase
+
+from blog.serializers import RowSerializer
+from post.models import Post
+from post.serializers import PostRepresentationSerializer
+from post.tests.factories import PostFactory
+from user.models import User
+from user.serializers import ListUserSerializer
+from user.tests.factories import UserFactory
+
+REPRESENTATIONS = (
+    {},
+    {'fields': 'id,title'},
+    {'fields': 'user,updated'},
+    {'view': 'summary'},
+    {'view': 'summary', 'fields': 'excerpt,user'},
+    {'view': 'summary', 'expand': 'user'},
+    {'view': 'summary', 'expand': 'user', 'fields': 'id,user'},
+)
+
+
+class RowSerializerTestCase(TestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456',
+                                             image='http://4.bp.blogspot.com/brett.png')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321',
+                                              avatar=f'{"a" * 64}.png')
+        self.user3 = UserFactory.create_batch(size=1, id=1234, displayName='Últimas Wiltshire', email='ultimas@email.com', password='654321')
+        PostFactory.create_batch(size=3, title='Últimas atualizações', content='Conteúdo do post ' * 30, user_id=self.user[0].id)
+        PostFactory.create_batch(size=2, title='title of the post', content='', user_id=self.user2[0].id)
+        PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user3[0].id)
+
+    def get_representation(self, params):
+        representation_serializer = PostRepresentationSerializer(data=params)
+        representation_serializer.is_valid(raise_exception=True)
+        return representation_serializer.validated_data
+
+    def test_posts_match_serializers(self):
+        post = Post.objects.order_by('-published', '-id')
+        for params in REPRESENTATIONS:
+            with self.subTest(**params):
+                representation = self.get_representation(params)
+                row_serializer = representation.get_row_serializer()
+
+                expected = representation.get_serializer(representation.get_queryset(post), many=True).data
+                self.assertEqual(row_serializer.serialize(representation.get_rows(post, row_serializer)), expected)
+
+    def test_users_match_serializer(self):
+        user = User.objects.order_by('id')
+        row_serializer = RowSerializer(ListUserSerializer())
+
+        self.assertEqual(row_serializer.serialize(user.values(*row_serializer.columns)), ListUserSerializer(user, many=True).data)
+
+    def test_reads_only_serialized_columns(self):
+        representation = self.get_representation({'view': 'summary', 'fields': 'title,user'})
+        row_serializer = representation.get_row_serializer()
+
+        self.assertEqual(row_serializer.columns, ['title', 'user__id', 'user__displayName'])
+        row = representation.get_rows(Post.objects.all(), row_serializer)[0]
+        self.assertEqual(list(row), ['id', 'published', 'title', 'user__id', 'user__displayName'])
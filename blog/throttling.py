@@ -0,0 +1,96 @@
+import time
+
+from django.core.cache import caches
+from rest_framework.throttling import BaseThrottle
+
+from blog.cache import LocalLRUCache
+from blog.metrics import throttle_requests
+from blog.settings import THROTTLE_BACKEND, THROTTLE_CACHE_SIZE, THROTTLE_RATES
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """'20/min' -> (20, 60), same format as the DRF throttle rates."""
+    num, period = rate.split('/')
+    return int(num), DURATIONS[period[0]]
+
+
+class TokenBucketStore:
+    """
+    Token buckets kept in ``cache``, a LocalLRUCache or one of ``CACHES``. A bucket holds
+    up to ``capacity`` tokens, refilled at ``capacity`` per ``period``; an expired entry is a
+    full bucket. Concurrent requests on the same bucket may both take its last token,
+    the limit is approximate by at most the number of concurrent requests.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def consume(self, key, capacity, period):
+        """Take a token, return 0 when allowed or else the seconds until a token is available."""
+        now = time.time()
+        tokens, updated = self.cache.get(key) or (capacity, now)
+        tokens = min(capacity, tokens + (now - updated) * capacity / period)
+
+        if tokens < 1:
+            return (1 - tokens) * period / capacity
+
+        self.cache.set(key, (tokens - 1, now), period)
+        return 0
+
+    def clear(self):
+        self.cache.clear()
+
+
+def get_throttle_store():
+    if THROTTLE_BACKEND:
+        return TokenBucketStore(caches[THROTTLE_BACKEND])
+    ttl = max(parse_rate(rate)[1] for rate in THROTTLE_RATES.values())
+    return TokenBucketStore(LocalLRUCache(max_size=THROTTLE_CACHE_SIZE, ttl=ttl))
+
+
+throttle_store = get_throttle_store()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Reject requests once the bucket of their client IP (``scope``) or of the email they
+    carry (``email_scope``) is empty. Only the request body is read, so throttled
+    requests never reach the database.
+    """
+    scope = None
+    email_scope = None
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def allow_request(self, request, view):
+        for scope, ident in self.get_buckets(request):
+            wait = throttle_store.consume(f'throttle:{scope}:{ident}', *parse_rate(THROTTLE_RATES[scope]))
+            if wait:
+                throttle_requests.labels(scope, 'throttled').inc()
+                self.wait_seconds = wait
+                return False
+            throttle_requests.labels(scope, 'allowed').inc()
+        return True
+
+    def get_buckets(self, request):
+        buckets = [(self.scope, self.get_ident(request))]
+
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if self.email_scope and isinstance(email, str) and email:
+            buckets.append((self.email_scope, email.strip().lower()))
+        return buckets
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class LoginThrottle(TokenBucketThrottle):
+    scope = 'login'
+    email_scope = 'login_email'
+
+
+class SignupThrottle(TokenBucketThrottle):
+    scope = 'signup'
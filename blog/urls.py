@@ -14,9 +14,14 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import include, path
+from django.urls import include, path, re_path
+
+from blog import views
+from blog.profiling import CAPTURE_NAME_RE
 
 urlpatterns = [
+    path('admin/profiles/', views.profile_list, name='profiles'),
+    re_path(rf'^admin/profiles/(?P<name>{CAPTURE_NAME_RE})\.(?P<ext>json|prof)$', views.profile_download, name='profile'),
     path('admin/', admin.site.urls),
     path('user', include(('user.urls', 'user'), namespace='user')),
     path('post', include(('post.urls', 'post'), namespace='post')),
@@ -3,5 +3,8 @@ def get_default_error_messages(min_length=None):
         'required': '"(field_name)" is required',
         'invalid': '"(field_name)" is not valid',
         'blank': '"(field_name)" is not allowed to be empty',
+        'empty': '"(field_name)" is not allowed to be empty',
+        'not_a_list': '"(field_name)" is not valid',
+        'invalid_choice': '"(field_name)" is not valid',
         'min_length': f'"(field_name)" length must by {min_length} long',
     }
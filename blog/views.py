@@ -0,0 +1,21 @@
+from django.contrib.admin.views.decorators import staff_member_required
+from django.http import FileResponse, Http404, JsonResponse
+
+from blog.profiling import get_profile_store
+
+CONTENT_TYPES = {'json': 'application/json', 'prof': 'application/octet-stream'}
+
+
+@staff_member_required
+def profile_list(request):
+    """Captures of blog.profiling, newest first. Staff users of the admin only."""
+    return JsonResponse({'results': get_profile_store().list()})
+
+
+@staff_member_required
+def profile_download(request, name, ext):
+    path = get_profile_store().path(name, ext)
+    if not path.exists():
+        raise Http404('Captura não existe')
+
+    return FileResponse(path.open('rb'), as_attachment=True, filename=path.name, content_type=CONTENT_TYPES[ext])
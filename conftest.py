@@ -0,0 +1,31 @@
+import pytest
+from django.core.cache import caches
+from django.db import connections
+
+from blog.throttling import throttle_store
+
+
+@pytest.fixture(autouse=True, scope='session')
+def disable_persistent_connections():
+    """
+    The async views query from the threads of blog.asynchronous.db_executor, persistent
+    connections left open there would keep the test database from being dropped.
+    """
+    conn_max_age = {alias: connections.databases[alias]['CONN_MAX_AGE'] for alias in connections}
+    for alias in connections:
+        connections.databases[alias]['CONN_MAX_AGE'] = 0
+    yield
+    for alias, value in conn_max_age.items():
+        connections.databases[alias]['CONN_MAX_AGE'] = value
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Cached responses must not leak between tests, factories write to the database without invalidating them."""
+    for cache in caches.all():
+        cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_throttles():
+    throttle_store.clear()
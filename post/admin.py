@@ -1,5 +1,8 @@
 from django.contrib import admin
+from django.db import transaction
 
+from post.cache import invalidate_posts
+from post.counters import count_by_user, update_post_count
 from post.models import Post
 
 
@@ -8,3 +11,29 @@ class PostAdmin(admin.ModelAdmin):
     list_display = ('id', 'title', 'content')
     list_filter = ('id', 'title', 'content')
     search_fields = ('id', 'title', 'content')
+
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            if not change:
+                update_post_count(obj.user_id, 1)
+            elif 'user' in form.changed_data:
+                update_post_count(form.initial['user'], -1)
+                update_post_count(obj.user_id, 1)
+        invalidate_posts([obj.id])
+
+    def delete_model(self, request, obj):
+        pk = obj.id
+        with transaction.atomic():
+            super().delete_model(request, obj)
+            update_post_count(obj.user_id, -1)
+        invalidate_posts([pk])
+
+    def delete_queryset(self, request, queryset):
+        pks = list(queryset.values_list('id', flat=True))
+        with transaction.atomic():
+            counts = count_by_user(queryset)
+            super().delete_queryset(request, queryset)
+            for user_id, count in counts.items():
+                update_post_count(user_id, -count)
+        invalidate_posts(pks)
@@ -0,0 +1,13 @@
+from django.urls import re_path
+
+from blog.asynchronous import async_read_view
+from post import urls
+from post.views import PostViewSet
+
+urlpatterns = [
+    re_path(r'^/?$', async_read_view(urls.post_list), name='post-list'),
+    re_path(r'^/(?P<pk>\d+)/?$', async_read_view(urls.post_detail), name='post-detail'),
+    re_path(r'^/search/?$', async_read_view(urls.post_search), name='search'),
+    re_path(r'^/export/?$', async_read_view(PostViewSet.as_view({'get': 'export_async'})), name='export'),
+    *[pattern for pattern in urls.urlpatterns if pattern.name not in ('post-list', 'post-detail', 'search', 'export')],
+]
@@ -0,0 +1,84 @@
+import hashlib
+import time
+
+from django.core.cache import caches
+from django.db import transaction
+
+from blog.db import reads_from_replica
+from blog.metrics import post_cache_lookups
+from blog.settings import DB_REPLICA_PIN_SECONDS, POST_CACHE_BACKEND, POST_CACHE_TTL
+
+VERSION_KEY = 'post:version'
+# time.time() of the last invalidation
+WRITTEN_KEY = 'post:written'
+
+
+def get_post_cache():
+    return caches[POST_CACHE_BACKEND]
+
+
+def post_key(pk):
+    return f'post:detail:{pk}'
+
+
+def validators_key(key):
+    return f'{key}:validators'
+
+
+def collection_key(request):
+    """List and search pages are keyed by the full URI under the current version, bumped by every write."""
+    cache = get_post_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), None)
+        version = cache.get(VERSION_KEY)
+
+    digest = hashlib.md5(request.build_absolute_uri().encode('utf-8')).hexdigest()
+    return f'post:collection:{version}:{digest}'
+
+
+def get_or_build(endpoint, key, build):
+    """
+    Return the cached payload under ``key`` or store the one returned by ``build``.
+    A ``None`` payload (e.g. a missing post) is never cached.
+    """
+    cache = get_post_cache()
+    data = cache.get(key)
+    if data is not None:
+        post_cache_lookups.labels(endpoint, 'hit').inc()
+        return data
+
+    post_cache_lookups.labels(endpoint, 'miss').inc()
+    data = build()
+    if data is not None and not replica_may_lag(cache):
+        cache.set(key, data, POST_CACHE_TTL)
+    return data
+
+
+def replica_may_lag(cache):
+    """
+    Whether the payload was read from a replica that may not have the last write yet. It isn't cached
+    then: clients pinned to the primary after their write would get it from the cache for POST_CACHE_TTL.
+    """
+    return reads_from_replica() and time.time() - (cache.get(WRITTEN_KEY) or 0) < DB_REPLICA_PIN_SECONDS
+
+
+def invalidate_posts(pks=()):
+    """
+    Drop the cached ``pks`` and every cached collection once the current transaction commits (right away
+    outside of one). Invalidating earlier would let a concurrent read cache the rows of before the write.
+    """
+    pks = list(pks)
+    transaction.on_commit(lambda: drop_posts(pks))
+
+
+def drop_posts(pks):
+    cache = get_post_cache()
+    cache.set(WRITTEN_KEY, time.time(), None)
+    if pks:
+        cache.delete_many([key for pk in pks for key in (post_key(pk), validators_key(post_key(pk)))])
+
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), None)
@@ -0,0 +1,45 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from post.models import Post
+from post.representation import ORDERING_FIELDS
+
+
+def post_validators(pk):
+    """ETag and Last-Modified of one post, the author ``updated`` is part of it since the payload nests the author."""
+    row = Post.objects.filter(id=pk).values_list('updated', 'user__updated').first()
+    if row is None:
+        return None
+
+    updated, user_updated = row
+    return quote_etag(f'{pk}-{updated.timestamp()}-{user_updated.timestamp()}'), int(max(updated, user_updated).timestamp())
+
+
+def collection_validators(request, post, paginator):
+    """
+    ETag of a list or search page, derived from the rows the paginator reads for that page only: the
+    ids and update times of its posts and authors, and its count and links. No Last-Modified: the
+    update times of a page don't move when one of its posts is deleted.
+    """
+    page = paginator.paginate_queryset(post.values(*ORDERING_FIELDS, 'updated', 'user__updated'), request)
+    rows = [(row['id'], row['updated'].timestamp(), row['user__updated'].timestamp()) for row in page]
+    version = f'{request.get_full_path()}-{rows}-{paginator.get_paginated_response([]).data}'
+    return quote_etag(hashlib.md5(version.encode('utf-8')).hexdigest()), None
+
+
+def not_modified(request, validators):
+    etag, last_modified = validators
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        set_validators(response, validators)
+    return response
+
+
+def set_validators(response, validators):
+    etag, last_modified = validators
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
@@ -0,0 +1,50 @@
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from post.models import Post, PostStats
+from user.models import User
+
+
+def update_post_count(user_id, delta):
+    """
+    Shift the post counters of ``user_id`` and of the blog by ``delta``, in the
+    transaction of the write that created or deleted the posts. The stats row is
+    updated first, its lock is what rebuild_post_counters() waits on.
+    """
+    if not delta:
+        return
+
+    update_total_post_count(delta)
+    User.objects.filter(id=user_id).update(post_count=F('post_count') + delta)
+
+
+def update_total_post_count(delta):
+    if not delta or PostStats.objects.filter(id=PostStats.ID).update(post_count=F('post_count') + delta):
+        return
+
+    # No stats row (e.g. flushed table), the posts already hold this write
+    _, created = PostStats.objects.get_or_create(id=PostStats.ID, defaults={'post_count': Post.objects.count()})
+    if not created:
+        PostStats.objects.filter(id=PostStats.ID).update(post_count=F('post_count') + delta)
+
+
+def count_by_user(post):
+    """user_id -> number of posts in the ``post`` queryset."""
+    return dict(post.order_by().values('user_id').annotate(count=Count('id')).values_list('user_id', 'count'))
+
+
+@transaction.atomic
+def rebuild_post_counters():
+    """
+    Count the posts of every user and of the blog again. Writers block on the stats
+    row locked first, so their changes land either in the counts or on top of them.
+    """
+    PostStats.objects.get_or_create(id=PostStats.ID)
+    PostStats.objects.select_for_update().filter(id=PostStats.ID).first()
+
+    post_count = Post.objects.filter(user=OuterRef('pk')).order_by().values('user').annotate(count=Count('id')).values('count')
+    users = User.objects.update(post_count=Coalesce(Subquery(post_count), 0))
+    total = Post.objects.count()
+    PostStats.objects.filter(id=PostStats.ID).update(post_count=total)
+    return users, total
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from post.counters import rebuild_post_counters
+
+
+class Command(BaseCommand):
+    help = 'Recount User.post_count and the PostStats row from the posts, e.g. after writes that bypassed post.counters.'
+
+    def handle(self, *args, **options):
+        users, total = rebuild_post_counters()
+        self.stdout.write(f'{total} posts counted for {users} users')
@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-18 17:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['-published', '-id'], name='post_published_id_idx'),
+        ),
+    ]
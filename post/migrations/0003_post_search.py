@@ -0,0 +1,60 @@
+# Generated by Django 3.2 on 2026-10-18 17:44
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# The text search configuration must match post.search.SEARCH_CONFIG
+SEARCH_VECTOR_TRIGGER = """
+CREATE FUNCTION post_post_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.simple', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER post_post_search_vector_trigger
+    BEFORE INSERT OR UPDATE ON post_post
+    FOR EACH ROW EXECUTE PROCEDURE post_post_search_vector_update();
+
+UPDATE post_post SET search_vector =
+    setweight(to_tsvector('pg_catalog.simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('pg_catalog.simple', coalesce(content, '')), 'B');
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER = """
+DROP TRIGGER IF EXISTS post_post_search_vector_trigger ON post_post;
+DROP FUNCTION IF EXISTS post_post_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('post', '0002_post_published_id_idx'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER, DROP_SEARCH_VECTOR_TRIGGER),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='post_title_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['content'], name='post_content_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2 on 2026-10-18 18:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0004_user_password_hash'),
+        ('post', '0003_post_search'),
+    ]
+
+    operations = [
+        # The composite index is built before the one of the foreign key goes, user_id lookups are never left without one
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['user', '-published', '-id'], name='post_user_published_id_idx'),
+        ),
+        migrations.AlterField(
+            model_name='post',
+            name='user',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='post', to='user.user'),
+        ),
+    ]
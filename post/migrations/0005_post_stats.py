@@ -0,0 +1,34 @@
+# Generated by Django 3.2 on 2026-10-18 19:04
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def count_posts(apps, schema_editor):
+    Post = apps.get_model('post', 'Post')
+    PostStats = apps.get_model('post', 'PostStats')
+    User = apps.get_model('user', 'User')
+
+    post_count = Post.objects.filter(user=OuterRef('pk')).order_by().values('user').annotate(count=Count('id')).values('count')
+    User.objects.update(post_count=Coalesce(Subquery(post_count), 0))
+    PostStats.objects.create(id=1, post_count=Post.objects.count())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0005_user_post_count'),
+        ('post', '0004_post_user_published_id_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PostStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('post_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(count_posts, migrations.RunPython.noop),
+    ]
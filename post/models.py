@@ -1,3 +1,5 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from user.models import User
 
@@ -5,9 +7,31 @@ from user.models import User
 class Post(models.Model):
     title = models.TextField()
     content = models.TextField()
-    user = models.ForeignKey(User, related_name='post', on_delete=models.CASCADE)
+    # Indexed by post_user_published_id_idx, which starts with user_id
+    user = models.ForeignKey(User, related_name='post', on_delete=models.CASCADE, db_index=False)
     published = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(auto_now=True)
+    # Filled by the post_post_search_vector trigger, see migration 0003
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-published', '-id'], name='post_published_id_idx'),
+            models.Index(fields=['user', '-published', '-id'], name='post_user_published_id_idx'),
+            GinIndex(fields=['search_vector'], name='post_search_vector_idx'),
+            GinIndex(fields=['title'], name='post_title_trgm_idx', opclasses=['gin_trgm_ops']),
+            GinIndex(fields=['content'], name='post_content_trgm_idx', opclasses=['gin_trgm_ops']),
+        ]
 
     def __str__(self):
         return f'Post: {self.id}'
+
+
+class PostStats(models.Model):
+    """Single row of blog wide counters, see post.counters."""
+    ID = 1
+
+    post_count = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f'PostStats: {self.post_count} posts'
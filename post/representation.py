@@ -0,0 +1,56 @@
+from django.db.models.functions import Substr
+
+from blog.serializers import RowSerializer
+from blog.settings import POST_EXCERPT_LENGTH
+
+POST_VIEW_FULL = 'full'
+POST_VIEW_SUMMARY = 'summary'
+POST_VIEWS = (POST_VIEW_FULL, POST_VIEW_SUMMARY)
+
+# Always loaded, the pagination orders and builds its cursors on them
+ORDERING_FIELDS = ('id', 'published')
+
+
+class PostRepresentation:
+    """How posts are rendered (``view``, ``fields`` and ``expand`` query params) and the columns that takes to read."""
+
+    def __init__(self, serializer_class, view=POST_VIEW_FULL, fields=None, expand=()):
+        self.serializer_class = serializer_class
+        self.view = view
+        self.fields = fields
+        self.expand = expand
+        self.field_names = list(self.get_serializer().fields)
+
+    @property
+    def is_default(self):
+        return self.view == POST_VIEW_FULL and self.fields is None
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs['fields'] = self.fields
+        if self.view == POST_VIEW_SUMMARY:
+            kwargs['expand'] = self.expand
+        return self.serializer_class(*args, **kwargs)
+
+    def get_queryset(self, post):
+        columns = set(ORDERING_FIELDS) | {field_name for field_name in self.field_names if field_name not in ('user', 'excerpt')}
+
+        if 'user' in self.field_names:
+            post = post.select_related('user')
+            if self.view == POST_VIEW_SUMMARY and 'user' not in self.expand:
+                columns.update(('user__id', 'user__displayName'))
+            else:
+                columns.add('user')
+
+        return self.annotate(post).only(*columns)
+
+    def get_row_serializer(self):
+        return RowSerializer(self.get_serializer())
+
+    def get_rows(self, post, row_serializer):
+        """The ``.values()`` rows of ``post`` that ``row_serializer`` reads, author columns joined."""
+        return self.annotate(post).values(*dict.fromkeys((*ORDERING_FIELDS, *row_serializer.columns)))
+
+    def annotate(self, post):
+        if 'excerpt' in self.field_names:
+            post = post.annotate(excerpt=Substr('content', 1, POST_EXCERPT_LENGTH))
+        return post
@@ -0,0 +1,25 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F, Q
+
+SEARCH_CONFIG = 'simple'
+
+SEARCH_MODE_SUBSTRING = 'substring'
+SEARCH_MODE_FULLTEXT = 'fulltext'
+SEARCH_MODES = (SEARCH_MODE_SUBSTRING, SEARCH_MODE_FULLTEXT)
+
+
+def substring_search(post, q):
+    """Case sensitive substring match on title or content, served by the pg_trgm GIN indexes."""
+    if q:
+        post = post.filter(Q(title__contains=q) | Q(content__contains=q))
+    return post.order_by('-published', '-id')
+
+
+def fulltext_search(post, q):
+    """Match against the search_vector column, best ranked posts first (title matches weigh more than content)."""
+    if not q:
+        return post.order_by('-published', '-id')
+
+    query = SearchQuery(q, config=SEARCH_CONFIG, search_type='websearch')
+    return post.filter(search_vector=query).annotate(
+        rank=SearchRank(F('search_vector'), query)).order_by('-rank', '-published', '-id')
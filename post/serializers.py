@@ -1,8 +1,33 @@
+from django.utils import timezone
 from rest_framework import serializers
 
+from blog.settings import BULK_MAX_ITEMS
 from blog.utils import get_default_error_messages
+from user.models import User
 from user.serializers import ListUserSerializer
 from post.models import Post
+from post.representation import POST_VIEW_FULL, POST_VIEW_SUMMARY, POST_VIEWS, PostRepresentation
+from post.search import SEARCH_MODE_SUBSTRING, SEARCH_MODES
+
+
+class BulkPostListSerializer(serializers.ListSerializer):
+    """Writes every item of a ``many=True`` post serializer with a single bulk_create / bulk_update."""
+
+    def create(self, validated_data):
+        return Post.objects.bulk_create([
+            Post(title=item['title'], content=item['content'], user_id=self.child.user_id) for item in validated_data
+        ])
+
+    def update(self, instance, validated_data):
+        updated = timezone.now()
+        for post, item in zip(instance, validated_data):
+            for field_name in ('title', 'content', 'user_id'):
+                if field_name in item:
+                    setattr(post, field_name, item[field_name])
+            post.updated = updated
+
+        Post.objects.bulk_update(instance, ['title', 'content', 'user_id', 'updated'])
+        return instance
 
 
 class PostBlogSerializer(serializers.ModelSerializer):
@@ -16,6 +41,7 @@ class PostBlogSerializer(serializers.ModelSerializer):
     class Meta:
         model = Post
         fields = ('title', 'content')
+        list_serializer_class = BulkPostListSerializer
 
     def create(self, validated_data):  # pylint: disable=R0912
         post = Post.objects.create(
@@ -36,13 +62,105 @@ class EditPostBlogSerializer(serializers.ModelSerializer):
         fields = ('title', 'content', 'user_id')
 
 
-class ListPostSerializer(serializers.ModelSerializer):
-    user = ListUserSerializer()
+class BulkEditPostBlogSerializer(EditPostBlogSerializer):
+    id = serializers.IntegerField(error_messages=get_default_error_messages())
+
+    class Meta:
+        model = Post
+        fields = ('id', 'title', 'content', 'user_id')
+        list_serializer_class = BulkPostListSerializer
+
+
+class BulkDeletePostSerializer(serializers.Serializer):
+    ids = serializers.ListField(allow_empty=False, error_messages=get_default_error_messages())
+
+    def validate_ids(self, ids):
+        if not all(isinstance(pk, int) and not isinstance(pk, bool) for pk in ids):
+            raise serializers.ValidationError(get_default_error_messages()['invalid'])
+        if len(ids) > BULK_MAX_ITEMS:
+            raise serializers.ValidationError(f'"(field_name)" must have at most {BULK_MAX_ITEMS} items')
+        return ids
+
+
+class BulkPostResultSerializer(serializers.ModelSerializer):
+    user_id = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Post
+        fields = ('id', 'title', 'content', 'user_id', 'published', 'updated')
+
+
+class DynamicFieldsMixin:
+    """Serializes only the fields named by the ``fields`` kwarg, all of them when it is not given."""
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class AuthorSerializer(ListUserSerializer):
+    """The author nested in posts, without ``post_count``: it changes with every post of the author, not its ``updated`` the post validators use."""
+
+    class Meta(ListUserSerializer.Meta):
+        fields = ('id', 'displayName', 'email', 'image', 'updated')
+
+
+class ListPostSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    user = AuthorSerializer()
 
     class Meta:
         model = Post
-        fields = '__all__'
+        exclude = ('search_vector',)
+
+
+class AuthorSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = User
+        fields = ('id', 'displayName')
+
+
+class PostSummarySerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    excerpt = serializers.CharField(read_only=True)
+    user = AuthorSummarySerializer()
+
+    def __init__(self, *args, **kwargs):
+        expand = kwargs.pop('expand', ())
+        super().__init__(*args, **kwargs)
+
+        if 'user' in expand and 'user' in self.fields:
+            self.fields['user'] = AuthorSerializer()
+
+    class Meta:
+        model = Post
+        fields = ('id', 'title', 'excerpt', 'user', 'published', 'updated')
+
+
+class PostRepresentationSerializer(serializers.Serializer):
+    view = serializers.ChoiceField(choices=POST_VIEWS, default=POST_VIEW_FULL, error_messages=get_default_error_messages())
+    fields = serializers.CharField(required=False, error_messages=get_default_error_messages())
+    expand = serializers.CharField(required=False, error_messages=get_default_error_messages())
+
+    def validate(self, attrs):
+        serializer_class = PostSummarySerializer if attrs['view'] == POST_VIEW_SUMMARY else ListPostSerializer
+        fields = [field_name for field_name in attrs.get('fields', '').split(',') if field_name] or None
+        expand = [field_name for field_name in attrs.get('expand', '').split(',') if field_name]
+
+        if fields is not None and set(fields) - set(serializer_class().fields):
+            raise serializers.ValidationError({'fields': get_default_error_messages()['invalid']})
+        if set(expand) - {'user'}:
+            raise serializers.ValidationError({'expand': get_default_error_messages()['invalid']})
+
+        return PostRepresentation(serializer_class, view=attrs['view'], fields=fields, expand=expand)
+
+
+class PostFilterSerializer(serializers.Serializer):
+    user = serializers.IntegerField(required=False, error_messages=get_default_error_messages())
 
 
 class SearchPostSerializer(serializers.Serializer):
     q = serializers.CharField(allow_blank=True)
+    mode = serializers.ChoiceField(choices=SEARCH_MODES, default=SEARCH_MODE_SUBSTRING, error_messages=get_default_error_messages())
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_save, pre_delete
+from django.dispatch import receiver
+
+from post.cache import invalidate_posts
+from post.models import Post
+from user.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def invalidate_author_posts(sender, instance, created=False, **kwargs):  # pylint: disable=unused-argument
+    """Cached posts embed their author, drop them whenever the author changes or goes away."""
+    if created:
+        return
+
+    invalidate_posts(list(Post.objects.filter(user_id=instance.id).values_list('id', flat=True)))
@@ -0,0 +1,190 @@
+import gzip
+from unittest import mock, skipUnless
+
+from django.test import AsyncClient, TransactionTestCase, override_settings
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from blog import compression
+from post.cache import get_post_cache
+from post.tests.factories import PostFactory
+from user.cache import user_cache
+from user.tests.mock import mock_authenticate_credentials_success
+from user.tests.factories import UserFactory
+from user.utils import generate_access_token
+
+
+def compressed_responses(encoding, cache):
+    return REGISTRY.get_sample_value('blog_compression_responses_total', {'encoding': encoding, 'cache': cache}) or 0
+
+
+class CompressionTestCase(APITestCase):
+    def setUp(self):
+        get_post_cache().clear()
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=20, title='title of the post', content='Content of the post ' * 20, user_id=self.user[0].id)
+        self.url = reverse("post:post-list")
+
+    def get(self, url, **extra):
+        return self.client.get(url, HTTP_ACCEPT_ENCODING='gzip, deflate', **extra)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_compresses_large_responses(self):
+        response = self.get(self.url)
+        identity = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(response['Vary'], 'Accept, Accept-Encoding')
+        self.assertEqual(int(response['Content-Length']), len(response.content))
+        self.assertLess(len(response.content), len(identity.content))
+        self.assertEqual(gzip.decompress(response.content), identity.content)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_identity_without_accept_encoding(self):
+        response = self.client.get(self.url)
+
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept, Accept-Encoding')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch('blog.compression.COMPRESSION_MIN_SIZE', 1024)
+    def test_small_responses_not_compressed(self):
+        response = self.get(reverse("post:post-detail", kwargs={'pk': 99999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(response.has_header('Content-Encoding'))
+        self.assertEqual(response['Vary'], 'Accept')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_streaming_responses_not_compressed(self):
+        response = self.get(reverse("post:export"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header('Content-Encoding'))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_weak_etag(self):
+        response = self.get(self.url)
+        identity = self.client.get(self.url)
+        self.assertEqual(response['ETag'], f'W/{identity["ETag"]}')
+
+        response = self.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_cached_responses_compressed_once(self):
+        hits, misses = compressed_responses('gzip', 'hit'), compressed_responses('gzip', 'miss')
+        compress_gzip = mock.Mock(wraps=compression.compress_gzip)
+
+        with mock.patch.dict(compression.COMPRESSORS, {'gzip': compress_gzip}):
+            first = self.get(self.url)
+            second = self.get(self.url)
+
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(compress_gzip.call_count, 1)
+        self.assertEqual(compressed_responses('gzip', 'miss'), misses + 1)
+        self.assertEqual(compressed_responses('gzip', 'hit'), hits + 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_changed_payload_compressed_again(self):
+        first = self.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(reverse("post:post-detail", kwargs={'pk': self.post[-1].id}), {'title': 'Title edited', 'content': 'Content edited'})
+        second = self.get(self.url)
+
+        self.assertNotEqual(first.content, second.content)
+        self.assertEqual(gzip.decompress(second.content), self.client.get(self.url).content)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch('blog.compression.COMPRESSION_MIN_SIZE', 100)
+    def test_uncached_responses_not_stored(self):
+        none = compressed_responses('gzip', 'none')
+        response = self.get(f'{reverse("post:post-detail", kwargs={"pk": self.post[0].id})}?fields=id,content')
+
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(compressed_responses('gzip', 'none'), none + 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch('blog.compression.COMPRESSION_CACHE_BACKEND', '')
+    def test_cache_disabled(self):
+        none = compressed_responses('gzip', 'none')
+        self.get(self.url)
+
+        self.assertEqual(compressed_responses('gzip', 'none'), none + 1)
+
+    @skipUnless(compression.brotli, 'brotli is not installed')
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch('blog.compression.ENCODINGS', ['br', 'gzip'])
+    def test_brotli(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, br')
+
+        self.assertEqual(response['Content-Encoding'], 'br')
+        self.assertEqual(compression.brotli.decompress(response.content), self.client.get(self.url).content)
+
+    @skipUnless(compression.zstandard, 'zstandard is not installed')
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch('blog.compression.ENCODINGS', ['zstd', 'gzip'])
+    def test_zstd(self):
+        response = self.client.get(self.url, HTTP_ACCEPT_ENCODING='gzip, zstd')
+
+        self.assertEqual(response['Content-Encoding'], 'zstd')
+        self.assertEqual(compression.zstandard.ZstdDecompressor().decompress(response.content), self.client.get(self.url).content)
+
+
+@override_settings(ROOT_URLCONF='blog.asgi_urls')
+class AsyncCompressionTestCase(TransactionTestCase):
+    def setUp(self):
+        get_post_cache().clear()
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        PostFactory.create_batch(size=20, title='title of the post', content='Content of the post ' * 20, user=self.user[0])
+        self.client = AsyncClient()
+        # AsyncClient takes headers as lowercase keyword arguments
+        self.headers = {'authorization': generate_access_token(self.user[0])}
+
+    def tearDown(self):
+        user_cache.clear()
+
+    async def test_list_post(self):
+        response = await self.client.get(reverse('post:post-list'), accept_encoding='gzip', **self.headers)
+        identity = await self.client.get(reverse('post:post-list'), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.content), identity.content)
@@ -0,0 +1,196 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from post.counters import rebuild_post_counters
+from post.models import Post, PostStats
+from post.tests.factories import PostFactory
+from user.models import User
+from user.tests.mock import mock_authenticate_credentials_success
+from user.tests.factories import UserFactory
+
+
+class PostCountersTestCase(APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post = PostFactory.create_batch(size=2, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        self.post2 = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user2[0].id)
+        # Factories write the posts directly, bring the counters in line with them
+        rebuild_post_counters()
+        self.data = {'title': 'Latest updates, August 1st', 'content': 'The whole text for the blog post goes here in this key'}
+
+    def assertCounters(self, user_count, user2_count, total):
+        self.assertEqual(User.objects.get(id=self.user[0].id).post_count, user_count)
+        self.assertEqual(User.objects.get(id=self.user2[0].id).post_count, user2_count)
+        self.assertEqual(PostStats.objects.get(id=PostStats.ID).post_count, total)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_create_post_increments(self):
+        response = self.client.post(reverse("post:post-list"), data=self.data)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertCounters(3, 1, 4)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_invalid_post_keeps_counters(self):
+        response = self.client.post(reverse("post:post-list"), data={'title': 'Latest updates, August 1st'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertCounters(2, 1, 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_post_decrements(self):
+        response = self.client.delete(reverse("post:post-detail", kwargs={'pk': self.post[0].id}))
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertCounters(1, 1, 2)
+
+        response = self.client.delete(reverse("post:post-detail", kwargs={'pk': self.post2[0].id}))
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertCounters(1, 1, 2)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_create_and_delete(self):
+        response = self.client.post(reverse("post:bulk"), [self.data, self.data], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertCounters(4, 1, 5)
+
+        ids = [item['id'] for item in response.data] + [self.post[0].id]
+        response = self.client.delete(reverse("post:bulk"), {'ids': ids}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertCounters(1, 1, 2)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_delete_errors_keep_counters(self):
+        response = self.client.delete(reverse("post:bulk"), {'ids': [self.post[0].id, self.post2[0].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertCounters(2, 1, 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_edit_moves_post_between_authors(self):
+        url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+
+        response = self.client.put(url, {**self.data, 'user_id': self.user[0].id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCounters(2, 1, 3)
+
+        response = self.client.put(url, {**self.data, 'user_id': self.user2[0].id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCounters(1, 2, 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_moves_posts_between_authors(self):
+        data = [
+            {'id': self.post[0].id, **self.data, 'user_id': self.user2[0].id},
+            {'id': self.post[1].id, **self.data, 'user_id': self.user2[0].id},
+        ]
+        response = self.client.put(reverse("post:bulk"), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCounters(0, 3, 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_keeps_counters(self):
+        response = self.client.put(reverse("post:bulk"), [{'id': self.post[0].id, **self.data}], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCounters(2, 1, 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_user_removes_its_posts_from_total(self):
+        response = self.client.delete(reverse('user:delete'))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(User.objects.filter(id=self.user2[0].id).exists())
+        self.assertEqual(User.objects.get(id=self.user[0].id).post_count, 2)
+        self.assertEqual(PostStats.objects.get(id=PostStats.ID).post_count, 2)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_exposes_post_count(self):
+        self.client.post(reverse("post:post-list"), data=self.data)
+        response = self.client.get(reverse('user:get', kwargs={'pk': self.user[0].id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['post_count'], 3)
+
+        response = self.client.get(reverse('user:user-detail'))
+        self.assertEqual(sorted(user['post_count'] for user in response.data['results']), [1, 3])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_posts_nest_author_without_post_count(self):
+        response = self.client.get(reverse("post:post-detail", kwargs={'pk': self.post[0].id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('post_count', response.data['user'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_stats(self):
+        response = self.client.get(reverse("post:stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'post_count': 3})
+
+    def test_stats_missing_auth(self):
+        response = self.client.get(reverse("post:stats"))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_missing_stats_row_is_recounted(self):
+        PostStats.objects.all().delete()
+
+        self.client.post(reverse("post:post-list"), data=self.data)
+        self.assertCounters(3, 1, 4)
+
+    def test_rebuild_command(self):
+        User.objects.update(post_count=7)
+        PostStats.objects.update(post_count=0)
+        Post.objects.filter(id=self.post2[0].id).delete()
+
+        output = StringIO()
+        call_command('rebuild_post_counters', stdout=output)
+
+        self.assertCounters(2, 0, 2)
+        self.assertEqual(output.getvalue(), '2 posts counted for 2 users\n')
@@ -0,0 +1,50 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from blog.renderers import JSONRenderer, ORJSONRenderer
+from post.models import Post
+from post.tests.factories import PostFactory
+from user.tests.mock import mock_authenticate_credentials_success
+from user.tests.factories import UserFactory
+
+
+class ORJSONViewTestCase(APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        PostFactory.create_batch(size=30, title='Últimas atualizações', content='Conteúdo do post  ', user_id=self.user[0].id)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post(self):
+        response = self.client.get(f'{reverse("post:post-list")}?page_size=30')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_create_post_json(self):
+        data = {'title': 'Últimas atualizações, 1º de agosto', 'content': 'Conteúdo 😀'}
+        response = self.client.post(reverse("post:post-list"), data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['title'], data['title'])
+        self.assertTrue(Post.objects.filter(title=data['title'], content=data['content']).exists())
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_invalid_json(self):
+        response = self.client.post(reverse("post:post-list"), '{"title": ', content_type='application/json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
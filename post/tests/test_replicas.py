@@ -0,0 +1,33 @@
+import contextvars
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from blog.db import read_database
+from post.cache import drop_posts, get_or_build, get_post_cache
+
+
+class ReplicaPostCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        get_post_cache().clear()
+
+    def build(self, database, key='post:detail:1'):
+        def run():
+            read_database.set(database)
+            return get_or_build('detail', key, lambda: {'id': 1})
+
+        contextvars.copy_context().run(run)
+        return get_post_cache().get(key)
+
+    def test_replica_reads_not_cached_after_write(self):
+        drop_posts([1])
+
+        self.assertIsNone(self.build('replica_0'))
+        self.assertEqual(self.build('default'), {'id': 1})
+
+    @mock.patch('post.cache.DB_REPLICA_PIN_SECONDS', 5)
+    def test_replica_reads_cached_once_replicated(self):
+        with mock.patch('post.cache.time.time', return_value=1000):
+            drop_posts([1])
+        with mock.patch('post.cache.time.time', return_value=1006):
+            self.assertEqual(self.build('replica_0'), {'id': 1})
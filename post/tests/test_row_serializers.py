@@ -0,0 +1,64 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from post.cache import get_post_cache
+from post.tests.factories import PostFactory
+from post.views import PostViewSet
+from user.tests.mock import mock_authenticate_credentials_success
+from user.tests.factories import UserFactory
+
+
+class RowSerializerViewTestCase(APITestCase):
+    """Responses of the actions using RowSerializer are the ones of the DRF serializers."""
+
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456',
+                                             avatar=f'{"b" * 64}.webp')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post = PostFactory.create_batch(size=15, title='title of the post', content='Content of the post ' * 20, user_id=self.user[0].id)
+        PostFactory.create_batch(size=15, title='Últimas atualizações', content='Conteúdo', user_id=self.user2[0].id)
+
+    def get_both(self, url):
+        get_post_cache().clear()
+        response = self.client.get(url)
+
+        get_post_cache().clear()
+        with mock.patch.object(PostViewSet, 'row_serializer_actions', ()):
+            expected = self.client.get(url)
+
+        self.assertEqual(response.status_code, expected.status_code)
+        return response, expected
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_post_endpoints(self):
+        urls = [
+            reverse("post:post-list"),
+            f'{reverse("post:post-list")}?page_size=7&view=summary&expand=user',
+            f'{reverse("post:post-list")}?user={self.user2[0].id}&fields=id,user',
+            reverse("user:posts", kwargs={'pk': self.user[0].id}),
+            f'{reverse("post:search")}?q=title&view=summary',
+            f'{reverse("post:search")}?q=atualizações&mode=fulltext',
+            reverse("post:post-detail", kwargs={'pk': self.post[0].id}),
+            f'{reverse("post:post-detail", kwargs={"pk": self.post[0].id})}?view=summary&fields=excerpt',
+            reverse("post:post-detail", kwargs={'pk': 99999}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response, expected = self.get_both(url)
+                self.assertEqual(response.content, expected.content)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_post_cursor_pages(self):
+        url = f'{reverse("post:post-list")}?page_size=4'
+        while url:
+            response, expected = self.get_both(url)
+            self.assertEqual(response.content, expected.content)
+            url = response.data['next']
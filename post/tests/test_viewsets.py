@@ -1,14 +1,38 @@
+import json
+import threading
 from unittest import mock
 
+import jwt
+
+from django.db import connection
+from django.db.models.functions import Substr
+from django.test import AsyncClient, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from prometheus_client import REGISTRY
 from rest_framework import status
+from rest_framework.settings import api_settings
 from rest_framework.test import APITestCase
 
+from blog.asynchronous import ASGIHandler
+from post.cache import get_post_cache, post_key
 from post.models import Post
-from post.serializers import EditPostBlogSerializer, PostBlogSerializer, ListPostSerializer
+from post.serializers import BulkPostResultSerializer, EditPostBlogSerializer, PostBlogSerializer, ListPostSerializer, PostSummarySerializer
 from post.tests.factories import PostFactory
+from user.cache import user_cache
 from user.tests.mock import mock_authenticate_credentials_success
 from user.tests.factories import UserFactory
+from user.utils import generate_access_token
+
+
+class QueryCountMixin:
+    def count_queries(self, url, method='get', data=None, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            response = getattr(self.client, method)(url, data, **kwargs)
+
+        savepoints = ('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT')
+        queries = [query for query in context.captured_queries if not query['sql'].startswith(savepoints)]
+        return response.status_code, len(queries)
 
 
 class CreatePostViewTestCase(APITestCase):
@@ -74,10 +98,43 @@ class ListPostViewTestCase(APITestCase):
     def test_list_post_success(self):
         response = self.client.get(self.url)
 
-        post_serializer = ListPostSerializer(self.post, many=True)
+        post_serializer = ListPostSerializer(reversed(self.post), many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(post_serializer.data, response.data)
+        self.assertEqual(post_serializer.data, response.data['results'])
+        self.assertIsNone(response.data['next'])
+        self.assertIsNone(response.data['previous'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_next_page(self):
+        post = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        response = self.client.get(f'{self.url}?page_size=2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ListPostSerializer([post[0], self.post[1]], many=True).data, response.data['results'])
+        self.assertIsNotNone(response.data['next'])
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ListPostSerializer([self.post[0]], many=True).data, response.data['results'])
+        self.assertIsNone(response.data['next'])
+        self.assertIsNotNone(response.data['previous'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch("blog.pagination.PostCursorPagination.max_page_size", 1)
+    def test_list_post_page_size_capped(self):
+        response = self.client.get(f'{self.url}?page_size=50')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNotNone(response.data['next'])
 
     def test_list_post_missing_auth(self):
         response = self.client.get(self.url)
@@ -85,6 +142,93 @@ class ListPostViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class AuthorPostViewTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post = PostFactory.create_batch(size=3, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        PostFactory.create_batch(size=2, title='another post', content='Content of another post', user_id=self.user2[0].id)
+        self.url = reverse('user:posts', kwargs={'pk': self.user[0].id})
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_posts(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ListPostSerializer(reversed(self.post), many=True).data, response.data['results'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_posts_next_page(self):
+        response = self.client.get(f'{self.url}?page_size=2')
+
+        self.assertEqual(ListPostSerializer([self.post[2], self.post[1]], many=True).data, response.data['results'])
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(ListPostSerializer([self.post[0]], many=True).data, response.data['results'])
+        self.assertIsNone(response.data['next'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_posts_queries(self):
+        self.assertEqual(self.count_queries(self.url), (status.HTTP_200_OK, 2))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_posts_user_not_found(self):
+        response = self.client.get(reverse('user:posts', kwargs={'pk': 99999}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.data, {'message': 'Usuário não existe'})
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_without_posts(self):
+        user = UserFactory.create_batch(size=1, displayName='raphael bezerra', email='raphael2@email.com', password='123457')
+
+        response = self.client.get(reverse('user:posts', kwargs={'pk': user[0].id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_filtered_by_user(self):
+        response = self.client.get(f'{reverse("post:post-list")}?user={self.user[0].id}')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ListPostSerializer(reversed(self.post), many=True).data, response.data['results'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_invalid_user_filter(self):
+        response = self.client.get(f'{reverse("post:post-list")}?user=raphael')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0].get('message'), '"user" is not valid')
+
+    def test_user_posts_missing_auth(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
 class GetPostViewTestCase(APITestCase):
     def setUp(self):
         self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
@@ -172,6 +316,17 @@ class PutPostViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
         self.assertEqual(response.data.get('message'), 'Usuário não autorizado')
 
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_put_post_unknown_author(self):
+        response = self.client.put(self.url, {**self.data, 'user_id': 99999})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [{'message': '\"user_id\" is not valid'}])
+        self.assertEqual(Post.objects.get(id=self.post[0].id).title, 'title of the post')
+
 
 class DeletePostViewTestCase(APITestCase):
     def setUp(self):
@@ -238,7 +393,7 @@ class SearchPostViewTestCase(APITestCase):
         post_serializer = ListPostSerializer(self.post, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(post_serializer.data, response.data)
+        self.assertEqual(post_serializer.data, response.data['results'])
 
     @mock.patch(
         "user.authentication.JWTCustomAuthentication.authenticate",
@@ -250,7 +405,7 @@ class SearchPostViewTestCase(APITestCase):
         post_serializer = ListPostSerializer(self.post2, many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(post_serializer.data, response.data)
+        self.assertEqual(post_serializer.data, response.data['results'])
 
     @mock.patch(
         "user.authentication.JWTCustomAuthentication.authenticate",
@@ -259,12 +414,831 @@ class SearchPostViewTestCase(APITestCase):
     def test_search_post_all_success(self):
         response = self.client.get(f'{self.url}?q=')
 
-        post_serializer = ListPostSerializer([self.post[0], self.post2[0]], many=True)
+        post_serializer = ListPostSerializer([self.post2[0], self.post[0]], many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(post_serializer.data, response.data)
+        self.assertEqual(post_serializer.data, response.data['results'])
+        self.assertEqual(response.data['count'], 2)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_page_size(self):
+        response = self.client.get(f'{self.url}?q=post&page_size=1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ListPostSerializer(self.post2, many=True).data, response.data['results'])
+        self.assertIsNotNone(response.data['next'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_fulltext_ranked(self):
+        post3 = PostFactory.create_batch(size=1, title='Something else', content='Nothing to see, just a second thought', user_id=self.user[0].id)
+        response = self.client.get(f'{self.url}?q=second&mode=fulltext')
+
+        post_serializer = ListPostSerializer([self.post2[0], post3[0]], many=True)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(post_serializer.data, response.data['results'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_fulltext_after_edit(self):
+        Post.objects.filter(id=self.post[0].id).update(content='Completely rewritten body')
+        response = self.client.get(f'{self.url}?q=rewritten&mode=fulltext')
+
+        post_serializer = ListPostSerializer(Post.objects.filter(id=self.post[0].id), many=True)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(post_serializer.data, response.data['results'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_invalid_mode(self):
+        response = self.client.get(f'{self.url}?q=post&mode=regex')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0].get('message'), '\"mode\" is not valid')
 
     def test_search_post_missing_auth(self):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class PostQueryCountTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+
+    def count_queries(self, url, method='get', data=None, **kwargs):
+        get_post_cache().clear()
+        return super().count_queries(url, method, data, **kwargs)
+
+    def create_posts(self, size):
+        PostFactory.create_batch(size=size, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        PostFactory.create_batch(size=size, title='title of the post', content='Content of the post', user_id=self.user2[0].id)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_queries(self):
+        url = reverse("post:post-list")
+        self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 2))
+
+        self.create_posts(size=10)
+        self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 2))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_queries(self):
+        # The count and the page rows, once for the validators and once for the payload
+        url = f'{reverse("post:search")}?q=title'
+        self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 4))
+
+        self.create_posts(size=10)
+        self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 4))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_get_post_queries(self):
+        url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+
+        self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 2))
+        self.assertEqual(self.count_queries(reverse("post:post-detail", kwargs={'pk': 99999})), (status.HTTP_404_NOT_FOUND, 1))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_edit_post_queries(self):
+        url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+        data = {'title': 'Title edited', 'content': 'Content edited'}
+
+        self.assertEqual(self.count_queries(url, method='put', data=data), (status.HTTP_200_OK, 2))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_post_queries(self):
+        other_post = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user2[0].id)
+
+        url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+        other_url = reverse("post:post-detail", kwargs={'pk': other_post[0].id})
+
+        # The delete and the updates of the author and blog post counters
+        self.assertEqual(self.count_queries(url, method='delete'), (status.HTTP_204_NO_CONTENT, 3))
+        self.assertEqual(self.count_queries(other_url, method='delete'), (status.HTTP_401_UNAUTHORIZED, 2))
+
+
+class PostCacheTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=2, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        self.list_url = reverse("post:post-list")
+        self.detail_url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+        self.search_url = f'{reverse("post:search")}?q=title'
+
+    def lookups(self, endpoint, result):
+        return REGISTRY.get_sample_value('blog_post_cache_lookups_total', {'endpoint': endpoint, 'result': result}) or 0
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_reads_served_from_cache(self):
+        for url, endpoint in ((self.list_url, 'list'), (self.detail_url, 'detail'), (self.search_url, 'search')):
+            hits = self.lookups(endpoint, 'hit')
+            response = self.client.get(url)
+
+            self.assertEqual(self.count_queries(url), (status.HTTP_200_OK, 0))
+            self.assertEqual(self.client.get(url).data, response.data)
+            self.assertEqual(self.lookups(endpoint, 'hit'), hits + 2)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_missing_post_not_cached(self):
+        url = reverse("post:post-detail", kwargs={'pk': 99999})
+        self.client.get(url)
+        post = PostFactory.create(id=99999, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, ListPostSerializer(post).data)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_create_invalidates_collections(self):
+        self.client.get(self.list_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.list_url, data={'title': 'title of a new post', 'content': 'Content'})
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(len(response.data['results']), 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_edit_invalidates_post(self):
+        self.client.get(self.detail_url)
+        self.client.get(self.search_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(self.detail_url, {'title': 'Title edited', 'content': 'Content edited'})
+
+        response = self.client.get(self.detail_url)
+        search_response = self.client.get(self.search_url)
+
+        self.assertEqual(response.data['title'], 'Title edited')
+        self.assertEqual(search_response.data['count'], 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_invalidates_post(self):
+        self.client.get(self.detail_url)
+        self.client.get(self.list_url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(self.detail_url)
+
+        response = self.client.get(self.detail_url)
+        list_response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(len(list_response.data['results']), 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_author_update_invalidates_posts(self):
+        self.client.get(self.detail_url)
+        self.client.get(self.list_url)
+
+        self.user[0].displayName = 'raphael bezerra'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user[0].save()
+
+        response = self.client.get(self.detail_url)
+        list_response = self.client.get(self.list_url)
+
+        self.assertEqual(response.data['user']['displayName'], 'raphael bezerra')
+        self.assertEqual(list_response.data['results'][0]['user']['displayName'], 'raphael bezerra')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_invalidation_waits_for_commit(self):
+        self.client.get(self.detail_url)
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.put(self.detail_url, {'title': 'Title edited', 'content': 'Content edited'})
+
+            # A read racing the write transaction can't cache the old rows under a new version
+            self.assertEqual(get_post_cache().get(post_key(self.post[0].id))['title'], 'title of the post')
+
+        for callback in callbacks:
+            callback()
+        self.assertIsNone(get_post_cache().get(post_key(self.post[0].id)))
+        self.assertEqual(self.client.get(self.detail_url).data['title'], 'Title edited')
+
+
+class ConditionalGetPostTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=2, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+        self.list_url = reverse("post:post-list")
+        self.detail_url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+        self.search_url = f'{reverse("post:search")}?q=title'
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_not_modified(self):
+        for url in (self.list_url, self.detail_url, self.search_url):
+            response = self.client.get(url)
+
+            self.client.credentials(HTTP_IF_NONE_MATCH=response['ETag'])
+            self.assertEqual(self.count_queries(url), (status.HTTP_304_NOT_MODIFIED, 0))
+            self.client.credentials()
+
+        response = self.client.get(self.detail_url)
+        self.client.credentials(HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(self.client.get(self.detail_url).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_collections_without_last_modified(self):
+        for url in (self.list_url, self.search_url):
+            self.assertNotIn('Last-Modified', self.client.get(url))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_with_if_modified_since(self):
+        last_modified = self.client.get(self.detail_url)['Last-Modified']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(reverse("post:post-detail", kwargs={'pk': self.post[1].id}))
+
+        self.client.credentials(HTTP_IF_MODIFIED_SINCE=last_modified)
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_not_modified_skips_serialization(self):
+        etag = self.client.get(self.detail_url)['ETag']
+        get_post_cache().clear()
+
+        self.client.credentials(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.count_queries(self.detail_url), (status.HTTP_304_NOT_MODIFIED, 1))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_edit_changes_etag(self):
+        etags = [self.client.get(url)['ETag'] for url in (self.list_url, self.detail_url)]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.put(self.detail_url, {'title': 'Title edited', 'content': 'Content edited'})
+
+        for url, etag in zip((self.list_url, self.detail_url), etags):
+            self.client.credentials(HTTP_IF_NONE_MATCH=etag)
+            response = self.client.get(url)
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_collection_validators_read_one_page(self):
+        PostFactory.create_batch(size=5, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+
+        with CaptureQueriesContext(connection) as context:
+            etag = self.client.get(f'{self.list_url}?page_size=2')['ETag']
+
+        self.assertTrue(all(' LIMIT 3' in query['sql'] for query in context.captured_queries if 'FROM "post_post"' in query['sql']))
+
+        # A post past the page leaves its ETag alone
+        get_post_cache().clear()
+        Post.objects.filter(id=self.post[0].id).delete()
+        self.client.credentials(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.client.get(f'{self.list_url}?page_size=2').status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_delete_changes_collection_etag(self):
+        etag = self.client.get(self.list_url)['ETag']
+        Post.objects.filter(id=self.post[1].id).delete()
+        get_post_cache().clear()
+
+        self.client.credentials(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(self.client.get(self.list_url).status_code, status.HTTP_200_OK)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_author_update_changes_etag(self):
+        etag = self.client.get(self.detail_url)['ETag']
+
+        self.user[0].displayName = 'raphael bezerra'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user[0].save()
+
+        self.client.credentials(HTTP_IF_NONE_MATCH=etag)
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['user']['displayName'], 'raphael bezerra')
+
+
+class ExportPostViewTestCase(APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post = PostFactory.create_batch(size=2, title='title of the post', content='Conteúdo do post', user_id=self.user[0].id)
+        self.post2 = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user2[0].id)
+        self.url = reverse("post:export")
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_export_post_success(self):
+        response = self.client.get(self.url)
+
+        post_serializer = ListPostSerializer(self.post + self.post2, many=True)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in lines], json.loads(json.dumps(post_serializer.data)))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch("post.views.EXPORT_CHUNK_SIZE", 1)
+    def test_export_post_chunked(self):
+        with mock.patch('django.db.models.query.QuerySet.iterator', autospec=True, side_effect=lambda qs, chunk_size: iter(qs)) as iterator:
+            response = self.client.get(self.url)
+            lines = b''.join(response.streaming_content).splitlines()
+
+        self.assertEqual(iterator.call_args[1], {'chunk_size': 1})
+        self.assertEqual(len(lines), 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_export_post_uses_api_renderer(self):
+        renderer = mock.Mock(**{'render.return_value': b'{}'})
+
+        with mock.patch.object(api_settings, 'DEFAULT_RENDERER_CLASSES', [mock.Mock(return_value=renderer)]):
+            response = self.client.get(self.url)
+            lines = b''.join(response.streaming_content).splitlines()
+
+        self.assertEqual(lines, [b'{}'] * 3)
+        self.assertEqual(renderer.render.call_count, 3)
+
+    def test_export_post_missing_auth(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class BulkPostViewTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=2, title='title of the post', content='Content of the post', user_id=self.user[0].id)
+
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+        self.post2 = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post', user_id=self.user2[0].id)
+        self.url = reverse("post:bulk")
+        self.data = [
+            {'title': 'Latest updates, August 1st', 'content': 'The whole text for the blog post goes here in this key'},
+            {'title': 'Latest updates, August 2nd', 'content': 'The whole text for the second blog post'},
+        ]
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_create_post_success(self):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(self.url, self.data, format='json')
+
+        post = Post.objects.filter(title__startswith='Latest updates').order_by('id')
+        post_serializer = BulkPostResultSerializer(post, many=True)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, post_serializer.data)
+        self.assertEqual(len([query for query in context.captured_queries if query['sql'].startswith('INSERT')]), 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_create_post_item_errors(self):
+        del self.data[1]['title']
+        response = self.client.post(self.url, self.data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [[], [{'message': '\"title\" is required'}]])
+        self.assertFalse(Post.objects.filter(title__startswith='Latest updates').exists())
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_create_post_not_a_list(self):
+        response = self.client.post(self.url, self.data[0], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data), 1)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    @mock.patch("post.views.BULK_MAX_ITEMS", 1)
+    def test_bulk_create_post_too_many(self):
+        response = self.client.post(self.url, self.data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0].get('message'), 'No more than 1 posts per request')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_post_success(self):
+        data = [{'id': self.post[0].id, 'title': 'Title edited', 'content': 'Content edited'},
+                {'id': self.post[1].id, 'title': 'Second title edited', 'content': 'Second content edited'}]
+        status_code, queries = self.count_queries(self.url, method='put', data=data, format='json')
+
+        post = Post.objects.filter(id__in=[self.post[0].id, self.post[1].id]).order_by('id')
+
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertEqual(queries, 2)
+        self.assertEqual([(item.title, item.content) for item in post],
+                         [('Title edited', 'Content edited'), ('Second title edited', 'Second content edited')])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_post_other_user(self):
+        data = [{'id': self.post[0].id, 'title': 'Title edited', 'content': 'Content edited'},
+                {'id': self.post2[0].id, 'title': 'Title edited', 'content': 'Content edited'},
+                {'id': 99999, 'title': 'Title edited', 'content': 'Content edited'}]
+        response = self.client.put(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [[], [{'message': 'Usuário não autorizado'}], [{'message': 'Post não existe'}]])
+        self.assertEqual(Post.objects.get(id=self.post[0].id).title, 'title of the post')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_post_unknown_author(self):
+        data = [{'id': self.post[0].id, 'title': 'Title edited', 'content': 'Content edited', 'user_id': 99999},
+                {'id': self.post[1].id, 'title': 'Title edited', 'content': 'Content edited', 'user_id': self.user2[0].id},
+                {'id': self.post[1].id, 'title': 'Title edited', 'content': 'Content edited'}]
+        response = self.client.put(self.url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [[{'message': '\"user_id\" is not valid'}], [], []])
+        self.assertEqual(Post.objects.get(id=self.post[0].id).user_id, self.user[0].id)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_edit_post_missing_id(self):
+        response = self.client.put(self.url, [{'title': 'Title edited', 'content': 'Content edited'}], format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [[{'message': '\"id\" is required'}]])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_delete_post_success(self):
+        response = self.client.delete(self.url, {'ids': [self.post[0].id, self.post[1].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(list(Post.objects.values_list('id', flat=True)), [self.post2[0].id])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_delete_post_other_user(self):
+        response = self.client.delete(self.url, {'ids': [self.post[0].id, self.post2[0].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, [[], [{'message': 'Usuário não autorizado'}]])
+        self.assertEqual(Post.objects.count(), 3)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_bulk_delete_post_invalid_ids(self):
+        response = self.client.delete(self.url, {'ids': [self.post[0].id, 'one']}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0].get('message'), '\"ids\" is not valid')
+
+    def test_bulk_post_missing_auth(self):
+        response = self.client.post(self.url, self.data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class SparseFieldsPostTestCase(APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456',
+                                             image='data:image/png;base64,iVBORw0KGgo=')
+        self.post = PostFactory.create_batch(size=1, title='title of the post', content='Content of the post ' * 50, user_id=self.user[0].id)
+        self.list_url = reverse("post:post-list")
+        self.detail_url = reverse("post:post-detail", kwargs={'pk': self.post[0].id})
+
+    def get_sql(self, url):
+        # Only the queries of the payload, the validators read their own columns
+        with CaptureQueriesContext(connection) as context, mock.patch('post.views.collection_validators', return_value=('"etag"', None)):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, ' '.join(query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT "post_post"."id"'))
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_fields(self):
+        response, sql = self.get_sql(f'{self.list_url}?fields=id,title')
+
+        self.assertEqual(response.data['results'], [{'id': self.post[0].id, 'title': 'title of the post'}])
+        self.assertNotIn('"post_post"."content"', sql)
+        self.assertNotIn('user_user', sql)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_summary(self):
+        response, sql = self.get_sql(f'{self.list_url}?view=summary')
+
+        item = response.data['results'][0]
+        self.assertEqual(set(item), {'id', 'title', 'excerpt', 'user', 'published', 'updated'})
+        self.assertEqual(item['excerpt'], self.post[0].content[:200])
+        self.assertEqual(item['user'], {'id': self.user[0].id, 'displayName': 'raphael nascimento'})
+        self.assertNotIn('"user_user"."image"', sql)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_get_post_summary_expand_user(self):
+        response = self.client.get(f'{self.detail_url}?view=summary&expand=user&fields=id,user')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data), {'id', 'user'})
+        self.assertEqual(response.data['user']['image'], 'data:image/png;base64,iVBORw0KGgo=')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_get_post_fields_not_cached_as_full(self):
+        self.client.get(f'{self.detail_url}?fields=title')
+        response = self.client.get(self.detail_url)
+
+        self.assertEqual(response.data, ListPostSerializer(self.post[0]).data)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_search_post_summary(self):
+        response = self.client.get(f'{reverse("post:search")}?q=title&view=summary')
+
+        post = Post.objects.annotate(excerpt=Substr('content', 1, 200)).select_related('user')
+        self.assertEqual(response.data['results'], PostSummarySerializer(post, many=True).data)
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_list_post_invalid_fields(self):
+        for query, field_name in (('fields=id,password', 'fields'), ('view=summary&fields=content', 'fields'), ('expand=post', 'expand')):
+            response = self.client.get(f'{self.list_url}?{query}')
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data[0].get('message'), f'"{field_name}" is not valid')
+
+
+class InstrumentationTestCase(APITestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=3, title='title', content='content', user=self.user[0])
+        self.client.credentials(HTTP_AUTHORIZATION=generate_access_token(self.user[0]))
+
+    def tearDown(self):
+        user_cache.clear()
+
+    def sample(self, name, view):
+        return REGISTRY.get_sample_value(name, {'view': view}) or 0
+
+    def test_list_post_metrics(self):
+        names = ('blog_view_db_queries_count', 'blog_view_db_queries_sum', 'blog_view_render_duration_seconds_count',
+                 'blog_view_auth_duration_seconds_count', 'blog_view_serialize_duration_seconds_count')
+        before = [self.sample(name, 'PostViewSet.list') for name in names]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('post:post-list'))
+
+        after = [self.sample(name, 'PostViewSet.list') for name in names]
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([value - before[index] for index, value in enumerate(after)], [1, len(context.captured_queries), 1, 1, 1])
+
+    def test_views_labelled_by_action(self):
+        before = self.sample('blog_view_db_queries_count', 'PostViewSet.get_post')
+
+        self.client.get(reverse('post:post-detail', args=[self.post[0].id]))
+        self.client.get(reverse('post:post-list'))
+
+        self.assertEqual(self.sample('blog_view_db_queries_count', 'PostViewSet.get_post') - before, 1)
+
+    def test_not_modified_is_not_rendered(self):
+        url = reverse('post:post-detail', args=[self.post[0].id])
+        etag = self.client.get(url)['ETag']
+        names = ('blog_view_render_duration_seconds_count', 'blog_view_serialize_duration_seconds_count')
+        before = [self.sample(name, 'PostViewSet.get_post') for name in names]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual([self.sample(name, 'PostViewSet.get_post') for name in names], before)
+
+    def test_user_views_serialize_metrics(self):
+        before = [self.sample('blog_view_serialize_duration_seconds_count', view) for view in ('UserViewSet.list', 'UserViewSet.get')]
+
+        self.client.get(reverse('user:user-detail'))
+        self.client.get(reverse('user:get', kwargs={'pk': self.user[0].id}))
+
+        after = [self.sample('blog_view_serialize_duration_seconds_count', view) for view in ('UserViewSet.list', 'UserViewSet.get')]
+        self.assertEqual([value - before[index] for index, value in enumerate(after)], [1, 1])
+
+
+@override_settings(ROOT_URLCONF='blog.asgi_urls')
+class AsyncPostViewTestCase(TransactionTestCase):
+    """The async views read on executor threads, their connections only see committed rows."""
+
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.post = PostFactory.create_batch(size=3, title='async', content='served from the executor', user=self.user[0])
+        self.client = AsyncClient()
+        # AsyncClient takes headers as lowercase keyword arguments
+        self.headers = {'authorization': generate_access_token(self.user[0])}
+
+    def tearDown(self):
+        user_cache.clear()
+
+    async def test_list_post(self):
+        response = await self.client.get(reverse('post:post-list'), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([post['id'] for post in response.json()['results']], [post.id for post in reversed(self.post)])
+
+    async def test_get_post(self):
+        response = await self.client.get(reverse('post:post-detail', args=[self.post[0].id]), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['id'], self.post[0].id)
+        self.assertEqual(response.json()['user']['id'], self.user[0].id)
+
+    async def test_get_post_not_found(self):
+        response = await self.client.get(reverse('post:post-detail', args=[0]), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(response.json(), {'message': 'Post não existe'})
+
+    async def test_search_post(self):
+        response = await self.client.get(reverse('post:search') + '?q=executor', **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 3)
+
+    async def test_unauthenticated(self):
+        response = await self.client.get(reverse('post:post-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_invalid_token(self):
+        token = jwt.encode({'user_id': self.user[0].id}, 'other_secret', algorithm='HS256').decode('utf-8')
+        response = await self.client.get(reverse('post:post-list'), authorization=token)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_view_runs_on_executor(self):
+        from post.views import PostViewSet
+
+        threads = []
+        get_post = PostViewSet.get_post
+
+        def record_thread(viewset, request, pk):
+            threads.append(threading.current_thread().name)
+            return get_post(viewset, request, pk)
+
+        with mock.patch.object(PostViewSet, 'get_post', record_thread):
+            response = await self.client.get(reverse('post:post-detail', args=[self.post[0].id]), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(threads[0].startswith('blog-db'))
+
+    async def test_metrics_recorded_on_executor(self):
+        before = REGISTRY.get_sample_value('blog_view_db_queries_sum', {'view': 'PostViewSet.list'}) or 0
+
+        response = await self.client.get(reverse('post:post-list'), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertGreaterEqual(REGISTRY.get_sample_value('blog_view_db_queries_sum', {'view': 'PostViewSet.list'}) - before, 2)
+
+    async def asgi_get(self, path, headers):
+        """Response of blog.asgi's handler as (status, body): AsyncClient doesn't go through its send_response."""
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request'}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'', 'server': ('testserver', 80),
+            'headers': [(key.encode('ascii'), value.encode('latin1')) for key, value in headers.items()],
+        }
+        await ASGIHandler()(scope, receive, send)
+        return messages[0]['status'], b''.join(message.get('body', b'') for message in messages[1:])
+
+    @mock.patch("post.views.EXPORT_CHUNK_SIZE", 2)
+    async def test_export_post(self):
+        status_code, body = await self.asgi_get(reverse('post:export'), self.headers)
+
+        self.assertEqual(status_code, status.HTTP_200_OK)
+        self.assertEqual([json.loads(line)['id'] for line in body.splitlines()], [post.id for post in self.post])
+        self.assertEqual(json.loads(body.splitlines()[0])['user']['id'], self.user[0].id)
+
+    async def test_export_post_unauthenticated(self):
+        status_code, _ = await self.asgi_get(reverse('post:export'), {})
+
+        self.assertEqual(status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_create_post(self):
+        data = {'title': 'written', 'content': 'through the async urlconf'}
+        response = await self.client.post(reverse('post:post-list'), data, content_type='application/json', **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['title'], 'written')
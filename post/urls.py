@@ -14,8 +14,19 @@ post_detail = PostViewSet.as_view({
     'delete': 'delete_post'
 })
 
+post_search = PostViewSet.as_view({'get': 'search'})
+
+post_bulk = PostViewSet.as_view({
+    'post': 'bulk_create',
+    'put': 'bulk_edit',
+    'delete': 'bulk_delete'
+})
+
 urlpatterns = [
     re_path(r'^/?$', post_list, name='post-list'),
     re_path(r'^/(?P<pk>\d+)/?$', post_detail, name='post-detail'),
-    re_path(r'^/search/?$', PostViewSet.as_view({'get': 'search'}), name='search'),
+    re_path(r'^/search/?$', post_search, name='search'),
+    re_path(r'^/bulk/?$', post_bulk, name='bulk'),
+    re_path(r'^/stats/?$', PostViewSet.as_view({'get': 'stats'}), name='stats'),
+    re_path(r'^/export/?$', PostViewSet.as_view({'get': 'export'}), name='export'),
 ]
@@ -1,65 +1,320 @@
-from django.db.models import Q
+from collections import Counter
+
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from rest_framework import status, viewsets
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 
-from post.models import Post
-from post.serializers import (EditPostBlogSerializer, ListPostSerializer,
-                              PostBlogSerializer, SearchPostSerializer)
+from blog.asynchronous import AsyncStreamingHttpResponse, database_sync_to_async
+from blog.compression import cache_compressed
+from blog.exception import format_errors
+from blog.instrumentation import timed
+from blog.pagination import PostCursorPagination, SearchPagination
+from blog.settings import BULK_MAX_ITEMS, EXPORT_CHUNK_SIZE
+from blog.utils import get_default_error_messages
+from post.cache import (collection_key, get_or_build, invalidate_posts,
+                        post_key, validators_key)
+from post.conditional import (collection_validators, not_modified,
+                              post_validators, set_validators)
+from post.counters import update_post_count
+from post.models import Post, PostStats
+from post.search import SEARCH_MODE_FULLTEXT, fulltext_search, substring_search
+from post.serializers import (BulkDeletePostSerializer,
+                              BulkEditPostBlogSerializer,
+                              BulkPostResultSerializer, EditPostBlogSerializer,
+                              ListPostSerializer, PostBlogSerializer,
+                              PostFilterSerializer,
+                              PostRepresentationSerializer,
+                              SearchPostSerializer)
+from user.models import User
 
 
 class PostViewSet(viewsets.ViewSet):
+    # Actions serializing .values() rows with blog.serializers.RowSerializer instead of model instances
+    row_serializer_actions = ('list', 'user_posts', 'get_post', 'search')
+
     def post(self, request):
         post_serializer = PostBlogSerializer(data=request.data, user_id=request.user.user.id)
         post_serializer.is_valid(raise_exception=True)
 
-        post_serializer.save()
+        with transaction.atomic():
+            post_serializer.save()
+            update_post_count(request.user.user.id, 1)
+
+        invalidate_posts()
         return Response(post_serializer.data, status.HTTP_201_CREATED)
 
     def list(self, request):
+        filter_serializer = PostFilterSerializer(data=request.query_params)
+        filter_serializer.is_valid(raise_exception=True)
+
         post = Post.objects.all()
-        list_post_serializer = ListPostSerializer(post, many=True)
-        return Response(list_post_serializer.data, status.HTTP_200_OK)
+        if 'user' in filter_serializer.validated_data:
+            post = post.filter(user_id=filter_serializer.validated_data['user'])
+        return self.list_posts(request, post, 'list')
+
+    def user_posts(self, request, pk):
+        response = self.list_posts(request, Post.objects.filter(user_id=pk), 'user_posts')
+
+        # Only an empty first page tells apart an author without posts from a missing one
+        if response.status_code == status.HTTP_200_OK and not response.data['results'] and not User.objects.filter(id=pk).exists():
+            return Response({'message': 'Usuário não existe'}, status.HTTP_404_NOT_FOUND)
+        return response
 
     def get_post(self, request, pk):
-        post = Post.objects.filter(id=pk)
-        if not post.exists():
+        representation = self.get_representation(request)
+        validators = get_or_build('detail_validators', validators_key(post_key(pk)), lambda: post_validators(pk))
+        if validators is None:
             return Response({'message': 'Post não existe'}, status.HTTP_404_NOT_FOUND)
 
-        post_serializer = ListPostSerializer(post[0])
-        return Response(post_serializer.data, status.HTTP_200_OK)
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
 
-    def delete_post(self, request, pk):
-        post = Post.objects.filter(id=pk)
-        if not post.exists():
+        if representation.is_default:
+            data = get_or_build('detail', post_key(pk), lambda: self.serialize_post(pk, representation))
+        else:
+            data = self.serialize_post(pk, representation)
+        if data is None:
             return Response({'message': 'Post não existe'}, status.HTTP_404_NOT_FOUND)
 
-        if post.exists() and post[0].user_id != request.user.user.id:
+        response = Response(data, status.HTTP_200_OK)
+        if representation.is_default:
+            cache_compressed(response)
+        return set_validators(response, validators)
+
+    def delete_post(self, request, pk):
+        with transaction.atomic():
+            deleted, _ = Post.objects.filter(id=pk, user_id=request.user.user.id).delete()
+            update_post_count(request.user.user.id, -deleted)
+
+        if not deleted:
+            if not Post.objects.filter(id=pk).exists():
+                return Response({'message': 'Post não existe'}, status.HTTP_404_NOT_FOUND)
+
             return Response({'message': 'Usuário não autorizado'}, status.HTTP_401_UNAUTHORIZED)
 
-        post[0].delete()
+        invalidate_posts([pk])
         return Response({}, status.HTTP_204_NO_CONTENT)
 
     def edit_post(self, request, pk):
-        post = Post.objects.filter(id=pk)
+        post = Post.objects.filter(id=pk).first()
 
-        if not post.exists():
+        if post is None:
             return Response({'message': 'Post não existe'}, status.HTTP_404_NOT_FOUND)
 
-        if post.exists() and post[0].user_id != request.user.user.id:
+        if post.user_id != request.user.user.id:
             return Response({'message': 'Usuário não autorizado'}, status.HTTP_401_UNAUTHORIZED)
 
-        post_serializer = EditPostBlogSerializer(post[0], data=request.data)
+        post_serializer = EditPostBlogSerializer(post, data=request.data)
         post_serializer.is_valid(raise_exception=True)
+        errors = self.author_errors([post_serializer.validated_data])
+        if errors is not None:
+            return Response(errors[0], status.HTTP_400_BAD_REQUEST)
 
-        post_serializer.save()
+        previous_user_id = post.user_id
+        with transaction.atomic():
+            post_serializer.save()
+            # user_id may move the post to another author
+            if post.user_id != previous_user_id:
+                update_post_count(previous_user_id, -1)
+                update_post_count(post.user_id, 1)
+
+        invalidate_posts([pk])
         return Response(post_serializer.data, status.HTTP_200_OK)
 
     def search(self, request):
         search_serializer = SearchPostSerializer(data=request.query_params)
         search_serializer.is_valid(raise_exception=True)
+        representation = self.get_representation(request)
+
+        post = Post.objects.all()
+        if search_serializer.validated_data['mode'] == SEARCH_MODE_FULLTEXT:
+            post = fulltext_search(post, search_serializer.validated_data['q'])
+        else:
+            post = substring_search(post, search_serializer.validated_data['q'])
+
+        key = collection_key(request)
+
+        validators = get_or_build('search_validators', validators_key(key), lambda: collection_validators(request, post, SearchPagination()))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        data = get_or_build('search', key, lambda: self.paginate(post, representation, SearchPagination(), request))
+        return set_validators(cache_compressed(Response(data, status.HTTP_200_OK)), validators)
+
+    def bulk_create(self, request):
+        post_serializer = PostBlogSerializer(data=request.data, many=True, user_id=request.user.user.id)
+        errors = self.bulk_errors(post_serializer)
+        if errors is not None:
+            return Response(errors, status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            post = post_serializer.save()
+            update_post_count(request.user.user.id, len(post))
+
+        invalidate_posts()
+        return Response(BulkPostResultSerializer(post, many=True).data, status.HTTP_201_CREATED)
+
+    def bulk_edit(self, request):
+        post_serializer = BulkEditPostBlogSerializer(data=request.data, many=True)
+        errors = self.bulk_errors(post_serializer)
+        if errors is not None:
+            return Response(errors, status.HTTP_400_BAD_REQUEST)
+
+        ids = [item['id'] for item in post_serializer.validated_data]
+        with transaction.atomic():
+            post = Post.objects.select_for_update().in_bulk(ids)
+            errors = [self.ownership_errors(post.get(pk), request) for pk in ids]
+            if any(errors):
+                return Response(errors, status.HTTP_400_BAD_REQUEST)
+
+            previous_user_ids = {pk: item.user_id for pk, item in post.items()}
+            post_serializer.instance = [post[pk] for pk in ids]
+            post_serializer.save()
+
+            moved = Counter()
+            for pk, item in post.items():
+                if item.user_id != previous_user_ids[pk]:
+                    moved[previous_user_ids[pk]] -= 1
+                    moved[item.user_id] += 1
+            for user_id, delta in moved.items():
+                update_post_count(user_id, delta)
+
+        invalidate_posts(ids)
+        return Response(BulkPostResultSerializer(post_serializer.instance, many=True).data, status.HTTP_200_OK)
+
+    def bulk_delete(self, request):
+        delete_serializer = BulkDeletePostSerializer(data=request.data)
+        delete_serializer.is_valid(raise_exception=True)
+
+        ids = delete_serializer.validated_data['ids']
+        with transaction.atomic():
+            post = Post.objects.select_for_update().only('id', 'user_id').in_bulk(ids)
+            errors = [self.ownership_errors(post.get(pk), request) for pk in ids]
+            if any(errors):
+                return Response(errors, status.HTTP_400_BAD_REQUEST)
+
+            deleted, _ = Post.objects.filter(id__in=ids).delete()
+            update_post_count(request.user.user.id, -deleted)
+
+        invalidate_posts(ids)
+        return Response({}, status.HTTP_204_NO_CONTENT)
+
+    def stats(self, request):
+        stats = PostStats.objects.filter(id=PostStats.ID).first()
+        return Response({'post_count': stats.post_count if stats is not None else 0}, status.HTTP_200_OK)
+
+    def bulk_errors(self, post_serializer):
+        """Errors of a bulk payload: one list of messages per item, or a single list when the payload itself is invalid."""
+        if isinstance(post_serializer.initial_data, list) and len(post_serializer.initial_data) > BULK_MAX_ITEMS:
+            return [{'message': f'No more than {BULK_MAX_ITEMS} posts per request'}]
+
+        if post_serializer.is_valid():
+            return self.author_errors(post_serializer.validated_data)
+
+        if isinstance(post_serializer.errors, dict):
+            return format_errors(post_serializer.errors)
+        return [format_errors(item_errors) for item_errors in post_serializer.errors]
+
+    def author_errors(self, items):
+        """Errors of the items moving a post to an author that doesn't exist, one query for all of them."""
+        user_ids = {item['user_id'] for item in items if 'user_id' in item}
+        if not user_ids:
+            return None
+
+        missing = user_ids - set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+        if not missing:
+            return None
+        return [format_errors({'user_id': [get_default_error_messages()['invalid']]}) if item.get('user_id') in missing else [] for item in items]
+
+    def ownership_errors(self, post, request):
+        if post is None:
+            return [{'message': 'Post não existe'}]
+
+        if post.user_id != request.user.user.id:
+            return [{'message': 'Usuário não autorizado'}]
+        return []
+
+    def export(self, request):
+        post = Post.objects.select_related('user').order_by('id').iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        return StreamingHttpResponse(self.stream_posts(post), content_type='application/x-ndjson', status=status.HTTP_200_OK)
+
+    def stream_posts(self, post):
+        """One JSON document per line, rows are pulled from a server side cursor while the response is sent."""
+        # The JSON renderer of the API (API_JSON), lines are rendered like the bodies of the other views
+        renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+        list_post_serializer = ListPostSerializer()
+        for item in post:
+            yield renderer.render(list_post_serializer.to_representation(item)) + b'\n'
+
+    def export_async(self, request):
+        """export() of blog.asgi, where streamed bodies are sent from the event loop and the ORM can't run."""
+        return AsyncStreamingHttpResponse(self.stream_posts_async(), content_type='application/x-ndjson', status=status.HTTP_200_OK)
+
+    async def stream_posts_async(self):
+        """The lines of stream_posts(), EXPORT_CHUNK_SIZE posts after the last one sent are read and rendered on db_executor."""
+        last_id = 0
+        while True:
+            content, last_id = await database_sync_to_async(self.render_posts_after)(last_id)
+            if last_id is None:
+                return
+            yield content
+
+    def render_posts_after(self, last_id):
+        # Keyset pages instead of a server side cursor, every page may run on another executor thread and connection
+        post = list(Post.objects.select_related('user').filter(id__gt=last_id).order_by('id')[:EXPORT_CHUNK_SIZE])
+        if not post:
+            return b'', None
+        return b''.join(self.stream_posts(post)), post[-1].id
+
+    def list_posts(self, request, post, endpoint):
+        """Newest first with cursor pagination, served by post_published_id_idx or post_user_published_id_idx when filtered by author."""
+        representation = self.get_representation(request)
+        key = collection_key(request)
+
+        validators = get_or_build(f'{endpoint}_validators', validators_key(key), lambda: collection_validators(request, post, PostCursorPagination()))
+        response = not_modified(request, validators)
+        if response is not None:
+            return response
+
+        data = get_or_build(endpoint, key, lambda: self.paginate(post, representation, PostCursorPagination(), request))
+        return set_validators(cache_compressed(Response(data, status.HTTP_200_OK)), validators)
+
+    def get_representation(self, request):
+        representation_serializer = PostRepresentationSerializer(data=request.query_params)
+        representation_serializer.is_valid(raise_exception=True)
+        return representation_serializer.validated_data
+
+    def paginate(self, post, representation, paginator, request):
+        if self.action in self.row_serializer_actions:
+            row_serializer = representation.get_row_serializer()
+            page = paginator.paginate_queryset(representation.get_rows(post, row_serializer), request, view=self)
+            with timed('serialize_seconds'):
+                return paginator.get_paginated_response(row_serializer.serialize(page)).data
+
+        page = paginator.paginate_queryset(representation.get_queryset(post), request, view=self)
+
+        with timed('serialize_seconds'):
+            post_serializer = representation.get_serializer(page, many=True)
+            return paginator.get_paginated_response(post_serializer.data).data
+
+    def serialize_post(self, pk, representation):
+        post = Post.objects.filter(id=pk)
+        if self.action in self.row_serializer_actions:
+            row_serializer = representation.get_row_serializer()
+            row = representation.get_rows(post, row_serializer).first()
+            if row is None:
+                return None
+
+            with timed('serialize_seconds'):
+                return row_serializer.to_representation(row)
+
+        post = representation.get_queryset(post).first()
+        if post is None:
+            return None
 
-        post = Post.objects.filter(
-            Q(title__contains=search_serializer.validated_data['q']) | Q(
-                content__contains=search_serializer.validated_data['q']))
-        list_post_serializer = ListPostSerializer(post, many=True)
-        return Response(list_post_serializer.data, status.HTTP_200_OK)
+        with timed('serialize_seconds'):
+            return representation.get_serializer(post).data
@@ -1,10 +1,24 @@
 from django.contrib import admin
+from django.db import transaction
 
+from post.counters import update_total_post_count
+from post.models import Post
 from user.models import User
 
 
 @admin.register(User)
 class UserAdmin(admin.ModelAdmin):
-    list_display = ('id', 'displayName')
+    list_display = ('id', 'displayName', 'post_count')
     list_filter = ('id', 'displayName')
     search_fields = ('id', 'displayName')
+    readonly_fields = ('post_count',)
+
+    def delete_model(self, request, obj):
+        with transaction.atomic():
+            _, deleted = obj.delete()
+            update_total_post_count(-deleted.get(Post._meta.label, 0))
+
+    def delete_queryset(self, request, queryset):
+        with transaction.atomic():
+            _, deleted = queryset.delete()
+            update_total_post_count(-deleted.get(Post._meta.label, 0))
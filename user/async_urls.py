@@ -0,0 +1,10 @@
+from django.urls import re_path
+
+from blog.asynchronous import async_read_view
+from user import urls
+
+urlpatterns = [
+    re_path(r'^/(?P<pk>\d+)/?$', async_read_view(urls.user_get), name='get'),
+    re_path(r'^/(?P<pk>\d+)/posts/?$', async_read_view(urls.user_posts), name='posts'),
+    *[pattern for pattern in urls.urlpatterns if pattern.name not in ('get', 'posts')],
+]
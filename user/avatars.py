@@ -0,0 +1,56 @@
+import base64
+import binascii
+import hashlib
+import re
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import get_storage_class
+from django.urls import reverse
+
+from blog.settings import AVATAR_MAX_BYTES, AVATAR_STORAGE, AVATAR_STORAGE_OPTIONS
+
+DATA_URI_RE = re.compile(r'^data:image/(?P<ext>png|jpeg|gif|webp);base64,(?P<data>.+)$', re.DOTALL)
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+}
+
+
+def get_avatar_storage():
+    return get_storage_class(AVATAR_STORAGE)(**AVATAR_STORAGE_OPTIONS)
+
+
+def is_data_uri(image):
+    return bool(image) and image.startswith('data:')
+
+
+def decode_data_uri(image):
+    """Extension and bytes of a base64 ``data:image/...`` URI, ValueError when it is not a valid one."""
+    match = DATA_URI_RE.match(image)
+    if match is None:
+        raise ValueError('Not an image data URI')
+
+    try:
+        content = base64.b64decode(match.group('data'), validate=True)
+    except binascii.Error as exc:
+        raise ValueError('Invalid base64 data') from exc
+
+    if not content or len(content) > AVATAR_MAX_BYTES:
+        raise ValueError('Invalid image size')
+    return match.group('ext'), content
+
+
+def save_avatar(ext, content):
+    """Store the image under its content hash, so the same upload is kept once and its URL never changes."""
+    name = f'{hashlib.sha256(content).hexdigest()}.{ext}'
+    storage = get_avatar_storage()
+    if not storage.exists(name):
+        storage.save(name, ContentFile(content))
+    return name
+
+
+def avatar_url(name):
+    digest, ext = name.split('.')
+    return reverse('user:avatar', kwargs={'digest': digest, 'ext': ext})
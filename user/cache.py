@@ -0,0 +1,50 @@
+from django.core.cache import caches
+
+from blog.cache import LocalLRUCache
+from blog.settings import (AUTH_USER_CACHE_BACKEND, AUTH_USER_CACHE_SIZE,
+                           AUTH_USER_CACHE_TTL, JWT_CACHE_SIZE, JWT_CACHE_TTL)
+
+
+class UserCache:
+    """
+    Users resolved by JWTCustomAuthentication, keyed by id.
+
+    Lookups go through a local LRU first and then, when ``backend`` names one of ``CACHES``,
+    through that shared cache. Entries are dropped once the writes of the User post_save/post_delete signals commit.
+    """
+    key_prefix = 'auth_user'
+
+    def __init__(self, max_size, ttl, backend=None):
+        self.ttl = ttl
+        self.backend = backend
+        self.local = LocalLRUCache(max_size=max_size, ttl=ttl)
+
+    def get(self, user_id):
+        user = self.local.get(user_id)
+        if user is None and self.backend:
+            user = caches[self.backend].get(self.make_key(user_id))
+            if user is not None:
+                self.local.set(user_id, user)
+        return user
+
+    def set(self, user):
+        self.local.set(user.id, user)
+        if self.backend:
+            caches[self.backend].set(self.make_key(user.id), user, self.ttl)
+
+    def delete(self, user_id):
+        self.local.delete(user_id)
+        if self.backend:
+            caches[self.backend].delete(self.make_key(user_id))
+
+    def clear(self):
+        self.local.clear()
+
+    def make_key(self, user_id):
+        return f'{self.key_prefix}:{user_id}'
+
+
+user_cache = UserCache(max_size=AUTH_USER_CACHE_SIZE, ttl=AUTH_USER_CACHE_TTL, backend=AUTH_USER_CACHE_BACKEND)
+
+# Access token -> verified payload, entries never outlive the token ``exp``
+token_cache = LocalLRUCache(max_size=JWT_CACHE_SIZE, ttl=JWT_CACHE_TTL)
@@ -0,0 +1,8 @@
+from django.contrib.auth import hashers
+
+from blog.settings import PASSWORD_HASH_ITERATIONS
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """Django's pbkdf2_sha256 with PASSWORD_HASH_ITERATIONS rounds, the stored hashes stay interchangeable."""
+    iterations = PASSWORD_HASH_ITERATIONS
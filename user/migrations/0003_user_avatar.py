@@ -0,0 +1,83 @@
+# Generated by Django 3.2 on 2026-10-18 17:54
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import get_storage_class
+from django.db import migrations, models
+
+import base64
+import binascii
+import hashlib
+import re
+
+# Frozen copy of user.avatars at the time of this migration, later changes to it must not change what it does
+DATA_URI_RE = re.compile(r'^data:image/(?P<ext>png|jpeg|gif|webp);base64,(?P<data>.+)$', re.DOTALL)
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'webp': 'image/webp',
+}
+
+
+def get_avatar_storage():
+    return get_storage_class(settings.AVATAR_STORAGE)(**settings.AVATAR_STORAGE_OPTIONS)
+
+
+def decode_data_uri(image):
+    match = DATA_URI_RE.match(image)
+    if match is None:
+        raise ValueError('Not an image data URI')
+
+    try:
+        content = base64.b64decode(match.group('data'), validate=True)
+    except binascii.Error as exc:
+        raise ValueError('Invalid base64 data') from exc
+
+    if not content or len(content) > settings.AVATAR_MAX_BYTES:
+        raise ValueError('Invalid image size')
+    return match.group('ext'), content
+
+
+def save_avatar(storage, ext, content):
+    name = f'{hashlib.sha256(content).hexdigest()}.{ext}'
+    if not storage.exists(name):
+        storage.save(name, ContentFile(content))
+    return name
+
+
+def move_images_to_avatar_storage(apps, schema_editor):
+    User = apps.get_model('user', 'User')
+    storage = get_avatar_storage()
+    for user in User.objects.filter(image__startswith='data:').only('id', 'image').iterator():
+        try:
+            avatar = save_avatar(storage, *decode_data_uri(user.image))
+        except ValueError:
+            continue
+        User.objects.filter(id=user.id).update(avatar=avatar, image=None)
+
+
+def move_avatars_back_to_image(apps, schema_editor):
+    User = apps.get_model('user', 'User')
+    storage = get_avatar_storage()
+    for user in User.objects.exclude(avatar=None).only('id', 'avatar').iterator():
+        with storage.open(user.avatar) as avatar:
+            content = base64.b64encode(avatar.read()).decode('ascii')
+        image = f"data:{CONTENT_TYPES[user.avatar.split('.')[1]]};base64,{content}"
+        User.objects.filter(id=user.id).update(avatar=None, image=image)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0002_user_updated'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='avatar',
+            field=models.CharField(blank=True, default=None, max_length=100, null=True),
+        ),
+        migrations.RunPython(move_images_to_avatar_storage, move_avatars_back_to_image),
+    ]
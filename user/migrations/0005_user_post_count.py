@@ -0,0 +1,18 @@
+# Generated by Django 3.2 on 2026-10-18 19:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('user', '0004_user_password_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='post_count',
+            field=models.IntegerField(default=0),
+        ),
+    ]
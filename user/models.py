@@ -1,11 +1,45 @@
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
 from django.db import models
+from django.utils.crypto import constant_time_compare
 
 
 class User(models.Model):
     displayName = models.CharField(max_length=150)
     email = models.CharField(max_length=100, unique=True)
-    password = models.CharField(max_length=10)
+    password = models.CharField(max_length=128)
     image = models.TextField(null=True, blank=True, default=None)
+    # Name of the uploaded image in the avatar storage, see user.avatars
+    avatar = models.CharField(max_length=100, null=True, blank=True, default=None)
+    updated = models.DateTimeField(auto_now=True)
+    # Maintained with F() updates by post.counters, rebuilt by the rebuild_post_counters command
+    post_count = models.IntegerField(default=0)
 
     def __str__(self):
         return f'User: {self.id}'
+
+    def set_password(self, raw_password):
+        self.password = make_password(raw_password)
+
+    def check_password(self, raw_password):
+        """
+        Compare ``raw_password`` with the stored hash. Rows still holding a plaintext
+        password, and hashes made with other hasher settings, are rehashed on success.
+        """
+        def upgrade(raw_password):
+            self.set_password(raw_password)
+            self.save(update_fields=['password'])
+
+        if not self.has_hashed_password():
+            if not constant_time_compare(raw_password, self.password):
+                return False
+            upgrade(raw_password)
+            return True
+
+        return check_password(raw_password, self.password, setter=upgrade)
+
+    def has_hashed_password(self):
+        try:
+            identify_hasher(self.password)
+        except ValueError:
+            return False
+        return True
@@ -1,12 +1,14 @@
+from django.contrib.auth.hashers import make_password
 from rest_framework import serializers, validators
 
+from user.avatars import avatar_url, decode_data_uri, is_data_uri, save_avatar
 from user.models import User
 from blog.utils import get_default_error_messages
 
 
 class UserSerializer(serializers.ModelSerializer):
     displayName = serializers.CharField(min_length=8, error_messages=get_default_error_messages(min_length=8))
-    password = serializers.CharField(min_length=6, error_messages=get_default_error_messages(min_length=6))
+    password = serializers.CharField(min_length=6, write_only=True, error_messages=get_default_error_messages(min_length=6))
     email = serializers.EmailField(
         error_messages=get_default_error_messages(),
         validators=[validators.UniqueValidator(queryset=User.objects.all(), message='User already exists')])
@@ -15,11 +17,36 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ('displayName', 'email', 'password', 'image')
 
+    def validate_image(self, image):
+        if is_data_uri(image):
+            try:
+                decode_data_uri(image)
+            except ValueError as exc:
+                raise serializers.ValidationError(get_default_error_messages()['invalid']) from exc
+        return image
+
+    def create(self, validated_data):
+        if is_data_uri(validated_data.get('image')):
+            validated_data['avatar'] = save_avatar(*decode_data_uri(validated_data['image']))
+            validated_data['image'] = None
+        validated_data['password'] = make_password(validated_data['password'])
+        return super().create(validated_data)
+
 
 class ListUserSerializer(serializers.ModelSerializer):
+    image = serializers.SerializerMethodField()
+    # Columns get_image() reads, see blog.serializers.RowSerializer
+    row_sources = {'image': ('avatar', 'image')}
+
     class Meta:
         model = User
-        fields = '__all__'
+        fields = ('id', 'displayName', 'email', 'image', 'updated', 'post_count')
+
+    def get_image(self, user):
+        """Uploaded avatars are rendered as the URL serving them, images given as links as they are."""
+        if user.avatar:
+            return avatar_url(user.avatar)
+        return user.image
 
 
 class LoginSerializer(serializers.ModelSerializer):
@@ -0,0 +1,30 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from user.avatars import get_avatar_storage
+from user.cache import user_cache
+from user.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Dropped once the write commits, a request in between would cache the row of before it again."""
+    user_id = instance.id
+    transaction.on_commit(lambda: user_cache.delete(user_id))
+
+
+@receiver(post_delete, sender=User)
+def delete_unused_avatar(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Avatars are stored by content hash and can be shared, only drop the file once no user points to it.
+    The file goes once the delete commits, a rolled back delete keeps the user and its avatar.
+    """
+    if instance.avatar:
+        transaction.on_commit(lambda: delete_avatar_if_unused(instance.avatar))
+
+
+def delete_avatar_if_unused(avatar):
+    if not User.objects.filter(avatar=avatar).exists():
+        get_avatar_storage().delete(avatar)
@@ -0,0 +1,183 @@
+import datetime
+from unittest import mock
+
+import jwt
+from asgiref.sync import async_to_sync
+from django.db import DatabaseError, transaction
+from django.test import TestCase, TransactionTestCase
+from prometheus_client import REGISTRY
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from blog.cache import LocalLRUCache
+from blog.settings import SECRET_JWT
+from user.authentication import JWTCustomAuthentication, decode_access_token
+from user.cache import UserCache, token_cache, user_cache
+from user.tests.factories import UserFactory
+from user.utils import generate_access_token
+
+
+class UserCacheAuthenticationTestCase(TestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.request = APIRequestFactory().get('/post', HTTP_AUTHORIZATION=generate_access_token(self.user[0]))
+
+    def tearDown(self):
+        user_cache.clear()
+
+    def test_authenticate_hits_database_once(self):
+        with self.assertNumQueries(1):
+            auth_user, _ = JWTCustomAuthentication().authenticate(self.request)
+
+        with self.assertNumQueries(0):
+            cached_auth_user, _ = JWTCustomAuthentication().authenticate(self.request)
+
+        self.assertEqual(auth_user.user.id, self.user[0].id)
+        self.assertEqual(cached_auth_user.user.id, self.user[0].id)
+
+    def test_user_save_invalidates_cache(self):
+        JWTCustomAuthentication().authenticate(self.request)
+
+        self.user[0].displayName = 'raphael bezerra'
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user[0].save()
+
+        with self.assertNumQueries(1):
+            auth_user, _ = JWTCustomAuthentication().authenticate(self.request)
+
+        self.assertEqual(auth_user.user.displayName, 'raphael bezerra')
+
+    def test_user_delete_invalidates_cache(self):
+        JWTCustomAuthentication().authenticate(self.request)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user[0].delete()
+
+        with self.assertRaisesMessage(AuthenticationFailed, 'Token não encontrado'):
+            JWTCustomAuthentication().authenticate(self.request)
+
+    def test_rolled_back_delete_keeps_cache(self):
+        JWTCustomAuthentication().authenticate(self.request)
+        user_id = self.user[0].id
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, self.assertRaises(DatabaseError):
+            with transaction.atomic():
+                self.user[0].delete()
+                # Until the delete commits the cached user stays, nothing can cache the old row again
+                self.assertIsNotNone(user_cache.get(user_id))
+                raise DatabaseError
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(user_cache.get(user_id).email, 'raphael@email.com')
+
+    def test_shared_backend_fills_local_cache(self):
+        cache = UserCache(max_size=10, ttl=60, backend='default')
+        cache.set(self.user[0])
+        cache.local.clear()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(cache.get(self.user[0].id).email, 'raphael@email.com')
+        self.assertEqual(len(cache.local), 1)
+
+        cache.delete(self.user[0].id)
+        self.assertIsNone(cache.get(self.user[0].id))
+
+
+class AsyncAuthenticationTestCase(TransactionTestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.request = APIRequestFactory().get('/post', HTTP_AUTHORIZATION=generate_access_token(self.user[0]))
+
+    def tearDown(self):
+        user_cache.clear()
+
+    def test_authenticate_async_fills_user_cache(self):
+        auth_user, _ = async_to_sync(JWTCustomAuthentication().authenticate_async)(self.request)
+
+        with mock.patch.object(JWTCustomAuthentication, 'get_cached_user') as get_cached_user:
+            cached_auth_user, _ = async_to_sync(JWTCustomAuthentication().authenticate_async)(self.request)
+
+        get_cached_user.assert_not_called()
+        self.assertEqual(auth_user.user.id, self.user[0].id)
+        self.assertEqual(cached_auth_user.user.id, self.user[0].id)
+
+    def test_authenticate_async_missing_user(self):
+        self.user[0].delete()
+
+        with self.assertRaisesMessage(AuthenticationFailed, 'Token não encontrado'):
+            async_to_sync(JWTCustomAuthentication().authenticate_async)(self.request)
+
+    def test_authenticate_uses_async_result(self):
+        self.request.jwt_authentication = None
+
+        self.assertIsNone(JWTCustomAuthentication().authenticate(self.request))
+
+
+class TokenCacheTestCase(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.exp = datetime.datetime.utcnow() + datetime.timedelta(minutes=10)
+        self.access_token = jwt.encode({'user_id': 1, 'exp': self.exp}, SECRET_JWT, algorithm='HS256').decode('utf-8')
+
+    def tearDown(self):
+        token_cache.clear()
+
+    def lookups(self, result):
+        return REGISTRY.get_sample_value('blog_jwt_cache_lookups_total', {'result': result}) or 0
+
+    def test_token_verified_once(self):
+        hits, misses = self.lookups('hit'), self.lookups('miss')
+
+        with mock.patch('user.authentication.jwt.decode', wraps=jwt.decode) as decode:
+            self.assertEqual(decode_access_token(self.access_token)['user_id'], 1)
+            self.assertEqual(decode_access_token(self.access_token)['user_id'], 1)
+
+        self.assertEqual(decode.call_count, 1)
+        self.assertEqual(self.lookups('hit'), hits + 1)
+        self.assertEqual(self.lookups('miss'), misses + 1)
+
+    def test_cached_token_expires_with_exp(self):
+        with mock.patch('blog.cache.time.monotonic', return_value=1000):
+            decode_access_token(self.access_token)
+
+        with mock.patch('blog.cache.time.monotonic', return_value=1590):
+            self.assertIsNotNone(token_cache.get(self.access_token))
+        with mock.patch('blog.cache.time.monotonic', return_value=1601):
+            self.assertIsNone(token_cache.get(self.access_token))
+
+    def test_invalid_token_not_cached(self):
+        access_token = jwt.encode({'user_id': 1, 'exp': self.exp}, 'other_secret', algorithm='HS256').decode('utf-8')
+
+        with self.assertRaises(jwt.InvalidSignatureError):
+            decode_access_token(access_token)
+        self.assertEqual(len(token_cache), 0)
+
+
+class LocalLRUCacheTestCase(TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LocalLRUCache(max_size=2, ttl=60)
+        cache.set(1, 'first')
+        cache.set(2, 'second')
+        cache.get(1)
+        cache.set(3, 'third')
+
+        self.assertEqual(cache.get(1), 'first')
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(3), 'third')
+
+    def test_entries_expire(self):
+        cache = LocalLRUCache(max_size=2, ttl=60)
+        with mock.patch('blog.cache.time.monotonic', return_value=100):
+            cache.set(1, 'first')
+
+        with mock.patch('blog.cache.time.monotonic', return_value=161):
+            self.assertIsNone(cache.get(1))
+        self.assertEqual(len(cache), 0)
+
+    def test_disabled_when_max_size_is_zero(self):
+        cache = LocalLRUCache(max_size=0, ttl=60)
+        cache.set(1, 'first')
+
+        self.assertIsNone(cache.get(1))
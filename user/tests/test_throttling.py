@@ -0,0 +1,125 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.urls import reverse
+from prometheus_client import REGISTRY
+from rest_framework import status
+from rest_framework.settings import api_settings
+from rest_framework.test import APITestCase
+
+from blog.cache import LocalLRUCache
+from blog.throttling import TokenBucketStore, parse_rate
+from post.tests.test_viewsets import QueryCountMixin
+from user.tests.factories import UserFactory
+
+RATES = {'login': '4/min', 'login_email': '2/min', 'signup': '2/hour'}
+
+
+@mock.patch.dict('blog.throttling.THROTTLE_RATES', RATES)
+class LoginThrottleTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.url = reverse('user:login')
+        self.data = {
+            'email': 'raphael@email.com',
+            'password': 'wrong_password'
+        }
+
+    def test_login_throttled_by_email(self):
+        for _ in range(2):
+            self.assertEqual(self.client.post(self.url, data=self.data).status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.count_queries(self.url, 'post', {**self.data, 'email': 'RAPHAEL@email.com '}), (status.HTTP_429_TOO_MANY_REQUESTS, 0))
+
+        response = self.client.post(self.url, data=self.data)
+        self.assertEqual(response.data, {'message': 'Muitas requisições, tente novamente em 30 segundos'})
+        self.assertEqual(response['Retry-After'], '30')
+
+    def test_login_throttled_by_ip(self):
+        for index in range(4):
+            self.client.post(self.url, data={**self.data, 'email': f'user{index}@email.com'})
+
+        response = self.client.post(self.url, data={**self.data, 'email': 'another@email.com'})
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_login_ips_have_own_buckets(self):
+        for index in range(4):
+            self.client.post(self.url, data={**self.data, 'email': f'user{index}@email.com'}, REMOTE_ADDR='10.0.0.1')
+
+        response = self.client.post(self.url, data={**self.data, 'password': '123456'}, REMOTE_ADDR='10.0.0.2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_forwarded_for_ignored_without_proxies(self):
+        for index in range(4):
+            self.client.post(self.url, data={**self.data, 'email': f'user{index}@email.com'}, REMOTE_ADDR='10.0.0.3',
+                             HTTP_X_FORWARDED_FOR=f'192.168.0.{index}')
+
+        response = self.client.post(self.url, data={**self.data, 'email': 'another@email.com'}, REMOTE_ADDR='10.0.0.3',
+                                    HTTP_X_FORWARDED_FOR='192.168.0.99')
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    @mock.patch.object(api_settings, 'NUM_PROXIES', 1)
+    def test_forwarded_for_behind_proxy(self):
+        for index in range(4):
+            self.client.post(self.url, data={**self.data, 'email': f'user{index}@email.com'}, REMOTE_ADDR='10.0.0.4',
+                             HTTP_X_FORWARDED_FOR='192.168.1.1')
+
+        response = self.client.post(self.url, data={**self.data, 'password': '123456'}, REMOTE_ADDR='10.0.0.4',
+                                    HTTP_X_FORWARDED_FOR='192.168.1.2')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_throttle_metrics(self):
+        before = REGISTRY.get_sample_value('blog_throttle_requests_total', {'scope': 'login_email', 'result': 'throttled'}) or 0
+
+        for _ in range(3):
+            self.client.post(self.url, data=self.data)
+
+        after = REGISTRY.get_sample_value('blog_throttle_requests_total', {'scope': 'login_email', 'result': 'throttled'})
+        self.assertEqual(after - before, 1)
+
+
+@mock.patch.dict('blog.throttling.THROTTLE_RATES', RATES)
+class SignupThrottleTestCase(QueryCountMixin, APITestCase):
+    def setUp(self):
+        self.url = reverse('user:user-detail')
+
+    def test_signup_throttled(self):
+        for index in range(2):
+            response = self.client.post(self.url, data={'displayName': 'Brett Wiltshire', 'email': f'brett{index}@email.com', 'password': '123456'})
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        data = {'displayName': 'Brett Wiltshire', 'email': 'brett@email.com', 'password': '123456'}
+        self.assertEqual(self.count_queries(self.url, 'post', data), (status.HTTP_429_TOO_MANY_REQUESTS, 0))
+
+    def test_list_not_throttled(self):
+        for _ in range(3):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TokenBucketStoreTestCase(SimpleTestCase):
+    def setUp(self):
+        self.store = TokenBucketStore(LocalLRUCache(max_size=10, ttl=60))
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('20/min'), (20, 60))
+        self.assertEqual(parse_rate('10/hour'), (10, 3600))
+
+    @mock.patch('blog.throttling.time.time')
+    def test_bucket_refills_over_period(self, time):
+        time.return_value = 1000.0
+        self.assertEqual([self.store.consume('key', 2, 60) for _ in range(3)], [0, 0, 30])
+
+        time.return_value = 1030.0
+        self.assertEqual(self.store.consume('key', 2, 60), 0)
+        self.assertEqual(self.store.consume('key', 2, 60), 30)
+
+    def test_buckets_are_independent(self):
+        self.assertEqual(self.store.consume('key', 1, 60), 0)
+        self.assertEqual(self.store.consume('other', 1, 60), 0)
+        self.assertGreater(self.store.consume('key', 1, 60), 0)
@@ -1,13 +1,21 @@
+import base64
+import shutil
+import tempfile
 from unittest import mock
 
+from django.db import DatabaseError, transaction
+from django.test import AsyncClient, TransactionTestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from user.cache import user_cache
 from user.tests.factories import UserFactory
 from user.tests.mock import mock_authenticate_credentials_success
 from user.models import User
 from user.serializers import ListUserSerializer
+from user.utils import generate_access_token
+from user.views import UserViewSet
 
 
 class CreateUserViewTestCase(APITestCase):
@@ -28,6 +36,8 @@ class CreateUserViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertNotEqual(len(response.data.get('token')), 0)
         self.assertEqual(user.displayName, 'Brett Wiltshire')
+        self.assertTrue(user.has_hashed_password())
+        self.assertTrue(user.check_password('123456'))
 
     def test_signup_missing_password(self):
         del self.data['password']
@@ -81,6 +91,45 @@ class LogInViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertNotEqual(len(response.data['token']), 0)
 
+    def test_login_hashed_password(self):
+        self.user[0].set_password('123456')
+        self.user[0].save()
+
+        response = self.client.post(self.url, data=self.data)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_login_upgrades_plaintext_password(self):
+        response = self.client.post(self.url, data=self.data)
+
+        user = User.objects.get(id=self.user[0].id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(user.password, '123456')
+        self.assertTrue(user.check_password('123456'))
+
+    def test_login_rehashes_with_new_iterations(self):
+        self.user[0].set_password('123456')
+        self.user[0].save()
+
+        with mock.patch('user.hashers.PBKDF2PasswordHasher.iterations', 1000):
+            response = self.client.post(self.url, data=self.data)
+
+        user = User.objects.get(id=self.user[0].id)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$1000$'))
+
+    def test_login_wrong_hashed_password(self):
+        self.user[0].set_password('123456')
+        self.user[0].save()
+        self.data['password'] = 'wrong_password'
+
+        response = self.client.post(self.url, data=self.data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data.get('message'), 'Campos inválidos')
+
     def test_login_wrong_password(self):
         self.data['password'] = 'wrong_password'
 
@@ -162,6 +211,35 @@ class GetUserViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+@override_settings(ROOT_URLCONF='blog.asgi_urls')
+class AsyncGetUserViewTestCase(TransactionTestCase):
+    def setUp(self):
+        user_cache.clear()
+        self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
+        self.url = reverse('user:get', kwargs={'pk': self.user[0].id})
+        self.client = AsyncClient()
+        self.headers = {'authorization': generate_access_token(self.user[0])}
+
+    def tearDown(self):
+        user_cache.clear()
+
+    async def test_get_user_success(self):
+        response = await self.client.get(self.url, **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()['email'], 'raphael@email.com')
+
+    async def test_get_user_missing_token_authorization(self):
+        response = await self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    async def test_get_user_404(self):
+        response = await self.client.get(reverse('user:get', kwargs={'pk': 99999}), **self.headers)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
 class ListUsersViewTestCase(APITestCase):
     def setUp(self):
         self.user = UserFactory.create_batch(size=1, displayName='raphael nascimento', email='raphael@email.com', password='123456')
@@ -178,7 +256,24 @@ class ListUsersViewTestCase(APITestCase):
         user_serializer = ListUserSerializer([self.user[0], self.user2[0]], many=True)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, user_serializer.data)
+        self.assertEqual(response.data['results'], user_serializer.data)
+        self.assertIsNone(response.data['next'])
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_get_list_user_next_page(self):
+        response = self.client.get(f'{self.url}?page_size=1')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], ListUserSerializer([self.user[0]], many=True).data)
+
+        response = self.client.get(response.data['next'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], ListUserSerializer([self.user2[0]], many=True).data)
+        self.assertIsNone(response.data['next'])
 
     def test_get_list_user_missing_token_authorization(self):
         response = self.client.get(self.url)
@@ -186,6 +281,35 @@ class ListUsersViewTestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
+class RowSerializerUserViewTestCase(APITestCase):
+    """Responses of the actions using RowSerializer are the ones of ListUserSerializer."""
+
+    def setUp(self):
+        self.user = UserFactory.create_batch(size=1, id=401465483996, displayName='raphael nascimento', email='raphael@email.com', password='123456',
+                                             avatar=f'{"b" * 64}.webp')
+        self.user2 = UserFactory.create_batch(size=1, id=54684, displayName='Brett Wiltshire', email='brett@email.com', password='654321')
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_user_endpoints(self):
+        urls = [
+            reverse('user:user-detail'),
+            f'{reverse("user:user-detail")}?page_size=1',
+            reverse('user:get', kwargs={'pk': self.user[0].id}),
+            reverse('user:get', kwargs={'pk': 99999}),
+        ]
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                with mock.patch.object(UserViewSet, 'row_serializer_actions', ()):
+                    expected = self.client.get(url)
+
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+
+
 class DeleteUserViewTestCase(APITestCase):
     def setUp(self):
         self.user = UserFactory.create_batch(size=1, displayName='Brett Wiltshire', email='brett@email.com', password='123456')
@@ -208,3 +332,84 @@ class DeleteUserViewTestCase(APITestCase):
         response = self.client.delete(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class AvatarViewTestCase(APITestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        patcher = mock.patch.dict('user.avatars.AVATAR_STORAGE_OPTIONS', {'location': self.location})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.location)
+
+        self.content = b'\x89PNG\r\n\x1a\nfake image content'
+        self.url = reverse("user:user-detail")
+        self.data = {
+            'displayName': 'Brett Wiltshire',
+            'email': 'brett@email.com',
+            'password': 123456,
+            'image': f'data:image/png;base64,{base64.b64encode(self.content).decode()}'
+        }
+
+    @mock.patch(
+        "user.authentication.JWTCustomAuthentication.authenticate",
+        mock_authenticate_credentials_success(),
+    )
+    def test_signup_image_moved_to_storage(self):
+        response = self.client.post(self.url, data=self.data)
+
+        user = User.objects.get(email='brett@email.com')
+        user_response = self.client.get(reverse('user:get', kwargs={'pk': user.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIsNone(user.image)
+        self.assertEqual(user_response.data['image'], f'/user/avatar/{user.avatar}')
+
+        avatar_response = self.client.get(user_response.data['image'])
+
+        self.assertEqual(avatar_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b''.join(avatar_response.streaming_content), self.content)
+        self.assertEqual(avatar_response['Content-Type'], 'image/png')
+        self.assertEqual(avatar_response['Cache-Control'], 'public, max-age=31536000, immutable')
+
+        self.client.credentials(HTTP_IF_NONE_MATCH=avatar_response['ETag'])
+        self.assertEqual(self.client.get(user_response.data['image']).status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_signup_image_link_kept(self):
+        self.data['image'] = 'http://4.bp.blogspot.com/_YA50adQ-7vQ/S1gfR_6ufpI/AAAAAAAAAAk/1ErJGgRWZDg/S45/brett.png'
+        self.client.post(self.url, data=self.data)
+
+        user = User.objects.get(email='brett@email.com')
+
+        self.assertIsNone(user.avatar)
+        self.assertEqual(ListUserSerializer(user).data['image'], self.data['image'])
+
+    def test_signup_invalid_image(self):
+        self.data['image'] = 'data:image/png;base64,not base64'
+        response = self.client.post(self.url, data=self.data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0].get('message'), '\"image\" is not valid')
+
+    def test_delete_user_removes_avatar(self):
+        self.client.post(self.url, data=self.data)
+        user = User.objects.get(email='brett@email.com')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            user.delete()
+
+        self.assertEqual(self.client.get(f'/user/avatar/{user.avatar}').status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_rolled_back_delete_keeps_avatar(self):
+        self.client.post(self.url, data=self.data)
+        user = User.objects.get(email='brett@email.com')
+        pk = user.id
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks, self.assertRaises(DatabaseError):
+            with transaction.atomic():
+                user.delete()
+                raise DatabaseError
+
+        self.assertEqual(callbacks, [])
+        self.assertTrue(User.objects.filter(id=pk).exists())
+        self.assertEqual(self.client.get(f'/user/avatar/{user.avatar}').status_code, status.HTTP_200_OK)
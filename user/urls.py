@@ -1,6 +1,7 @@
 from django.urls import re_path
 
-from user.views import LoginViewSet, UserViewSet
+from post.views import PostViewSet
+from user.views import AvatarViewSet, LoginViewSet, UserViewSet
 
 
 user_detail = UserViewSet.as_view({
@@ -8,9 +9,15 @@ user_detail = UserViewSet.as_view({
     'get': 'list'
 })
 
+user_get = UserViewSet.as_view({'get': 'get'})
+
+user_posts = PostViewSet.as_view({'get': 'user_posts'})
+
 urlpatterns = [
     re_path(r'^/?$', user_detail, name='user-detail'),
-    re_path(r'^/(?P<pk>\d+)/?$', UserViewSet.as_view({'get': 'get'}), name='get'),
+    re_path(r'^/(?P<pk>\d+)/?$', user_get, name='get'),
+    re_path(r'^/(?P<pk>\d+)/posts/?$', user_posts, name='posts'),
     re_path(r'^/me/?$', UserViewSet.as_view({'delete': 'delete'}), name='delete'),
+    re_path(r'^/avatar/(?P<digest>[0-9a-f]{64})\.(?P<ext>png|jpeg|gif|webp)$', AvatarViewSet.as_view({'get': 'get'}), name='avatar'),
     re_path(r'^/login/?$', LoginViewSet.as_view({'post': 'login'}), name='login'),
 ]
@@ -1,7 +1,19 @@
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.http import FileResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import status, viewsets
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from blog.instrumentation import timed
+from blog.pagination import UserCursorPagination
+from blog.serializers import RowSerializer
+from blog.throttling import LoginThrottle, SignupThrottle
+from post.counters import update_total_post_count
+from post.models import Post
+from user.avatars import CONTENT_TYPES, get_avatar_storage
 from user.models import User
 from user.serializers import (ListUserSerializer, LoginSerializer,
                               UserSerializer)
@@ -13,6 +25,9 @@ class UserViewSet(viewsets.ViewSet):
                                     'list': [IsAuthenticated],
                                     'get': [IsAuthenticated],
                                     'delete': [IsAuthenticated]}
+    throttle_classes_by_action = {'post': [SignupThrottle]}
+    # Actions serializing .values() rows with blog.serializers.RowSerializer instead of model instances
+    row_serializer_actions = ('list', 'get')
 
     def post(self, request):
         user_serializer = UserSerializer(data=request.data)
@@ -26,20 +41,43 @@ class UserViewSet(viewsets.ViewSet):
 
     def list(self, request):
         user = User.objects.all()
-        list_user_serializer = ListUserSerializer(user, many=True)
-        return Response(list_user_serializer.data, status.HTTP_200_OK)
+        paginator = UserCursorPagination()
+        if self.action in self.row_serializer_actions:
+            row_serializer = RowSerializer(ListUserSerializer())
+            page = paginator.paginate_queryset(user.values(*row_serializer.columns), request, view=self)
+            with timed('serialize_seconds'):
+                return paginator.get_paginated_response(row_serializer.serialize(page))
+
+        page = paginator.paginate_queryset(user, request, view=self)
+
+        with timed('serialize_seconds'):
+            list_user_serializer = ListUserSerializer(page, many=True)
+            return paginator.get_paginated_response(list_user_serializer.data)
 
     def get(self, request, pk):
         user = User.objects.filter(id=pk)
+        if self.action in self.row_serializer_actions:
+            row_serializer = RowSerializer(ListUserSerializer())
+            row = user.values(*row_serializer.columns).first()
+            if row is None:
+                return Response({'message': 'Usuário não existe'}, status.HTTP_404_NOT_FOUND)
+
+            with timed('serialize_seconds'):
+                return Response(row_serializer.to_representation(row), status.HTTP_200_OK)
+
         if not user.exists():
             return Response({'message': 'Usuário não existe'}, status.HTTP_404_NOT_FOUND)
 
-        user_serializer = ListUserSerializer(user[0])
-        return Response(user_serializer.data, status.HTTP_200_OK)
+        user = user[0]
+        with timed('serialize_seconds'):
+            user_serializer = ListUserSerializer(user)
+            return Response(user_serializer.data, status.HTTP_200_OK)
 
     def delete(self, request):
         user = User.objects.get(email=request.user.user.email)
-        user.delete()
+        with transaction.atomic():
+            _, deleted = user.delete()
+            update_total_post_count(-deleted.get(Post._meta.label, 0))
 
         return Response({}, status.HTTP_204_NO_CONTENT)
 
@@ -49,18 +87,52 @@ class UserViewSet(viewsets.ViewSet):
         except KeyError:
             return [permission() for permission in self.permission_classes]
 
+    def get_throttles(self):
+        try:
+            return [throttle() for throttle in self.throttle_classes_by_action[self.action]]
+        except KeyError:
+            return [throttle() for throttle in self.throttle_classes]
+
 
 class LoginViewSet(viewsets.ViewSet):
     permission_classes = (AllowAny,)
+    throttle_classes = (LoginThrottle,)
 
     def login(self, request):
         login_serializer = LoginSerializer(data=request.data)
         login_serializer.is_valid(raise_exception=True)
 
-        user = User.objects.filter(email=login_serializer.validated_data['email'], password=login_serializer.validated_data['password'])
+        password = login_serializer.validated_data['password']
+        user = User.objects.filter(email=login_serializer.validated_data['email']).first()
 
-        if not user.exists():
+        if user is None:
+            # Hash anyway, unknown emails must not answer faster than wrong passwords
+            make_password(password)
             return Response({'message': 'Campos inválidos'}, status.HTTP_400_BAD_REQUEST)
 
-        token = generate_access_token(user[0])
+        if not user.check_password(password):
+            return Response({'message': 'Campos inválidos'}, status.HTTP_400_BAD_REQUEST)
+
+        token = generate_access_token(user)
         return Response({'token': token}, status.HTTP_200_OK)
+
+
+class AvatarViewSet(viewsets.ViewSet):
+    """Uploaded avatars, public so that they can be linked from <img> tags. Names are content hashes, responses never change."""
+    authentication_classes = ()
+    permission_classes = (AllowAny,)
+
+    def get(self, request, digest, ext):
+        etag = quote_etag(digest)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            storage = get_avatar_storage()
+            name = f'{digest}.{ext}'
+            if not storage.exists(name):
+                return Response({'message': 'Imagem não existe'}, status.HTTP_404_NOT_FOUND)
+
+            response = FileResponse(storage.open(name), content_type=CONTENT_TYPES[ext])
+
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=31536000, immutable'
+        return response